@@ -23,40 +23,84 @@ __email__ = "ai-stock@example.com"
 __license__ = "MIT"
 __description__ = "AI-powered stock trading system with intelligent signal generation and automated monitoring"
 
-# 核心模块导入
-from ai_stock.core.types import (
-    Kline,
-    MarketData,
-    Signal,
-    OrderSide,
-    SignalStrength,
-    StrategyConfig,
-    BacktestConfig,
-    Trade,
-    EquityPoint,
-    BacktestResult,
-)
-
-from ai_stock.core.exceptions import (
-    AIStockError,
-    DataCollectionError,
-    StrategyError,
-    BacktestError,
-    SignalGenerationError,
-)
-
-# 主要服务类 - 只导入已经创建的
-from ai_stock.data.collectors.base_collector import BaseDataCollector
-from ai_stock.signals.generators.trading_signal_generator import TradingSignalGenerator
-# TODO: 后续创建这些模块时取消注释
-# from ai_stock.strategies.base_strategy import BaseStrategy
-# from ai_stock.backtest.engine.backtest_engine import BacktestEngine
-# from ai_stock.notifications.notification_manager import NotificationManager
-
-# 工具函数
-from ai_stock.utils.format_utils import FormatUtils
-from ai_stock.utils.date_utils import DateUtils
-from ai_stock.utils.math_utils import MathUtils
+import importlib
+import logging
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# 公共接口按需导入（PEP 562），避免 `import ai_stock` 时加载全部子模块
+_LAZY_IMPORTS = {
+    # 核心类型
+    "Kline": "ai_stock.core.types",
+    "MarketData": "ai_stock.core.types",
+    "Signal": "ai_stock.core.types",
+    "OrderSide": "ai_stock.core.types",
+    "SignalStrength": "ai_stock.core.types",
+    "StrategyConfig": "ai_stock.core.types",
+    "BacktestConfig": "ai_stock.core.types",
+    "Trade": "ai_stock.core.types",
+    "EquityPoint": "ai_stock.core.types",
+    "BacktestResult": "ai_stock.core.types",
+    # 异常类
+    "AIStockError": "ai_stock.core.exceptions",
+    "DataCollectionError": "ai_stock.core.exceptions",
+    "StrategyError": "ai_stock.core.exceptions",
+    "BacktestError": "ai_stock.core.exceptions",
+    "SignalGenerationError": "ai_stock.core.exceptions",
+    # 主要服务类 - 只导入已经创建的
+    "BaseDataCollector": "ai_stock.data.collectors.base_collector",
+    "TradingSignalGenerator": "ai_stock.signals.generators.trading_signal_generator",
+    # TODO: 后续创建这些模块时添加
+    # "BaseStrategy": "ai_stock.strategies.base_strategy",
+    # "BacktestEngine": "ai_stock.backtest.engine.backtest_engine",
+    # "NotificationManager": "ai_stock.notifications.notification_manager",
+    # 工具函数
+    "FormatUtils": "ai_stock.utils.format_utils",
+    "DateUtils": "ai_stock.utils.date_utils",
+    "MathUtils": "ai_stock.utils.math_utils",
+}
+
+if TYPE_CHECKING:
+    from ai_stock.core.types import (
+        Kline,
+        MarketData,
+        Signal,
+        OrderSide,
+        SignalStrength,
+        StrategyConfig,
+        BacktestConfig,
+        Trade,
+        EquityPoint,
+        BacktestResult,
+    )
+    from ai_stock.core.exceptions import (
+        AIStockError,
+        DataCollectionError,
+        StrategyError,
+        BacktestError,
+        SignalGenerationError,
+    )
+    from ai_stock.data.collectors.base_collector import BaseDataCollector
+    from ai_stock.signals.generators.trading_signal_generator import TradingSignalGenerator
+    from ai_stock.utils.format_utils import FormatUtils
+    from ai_stock.utils.date_utils import DateUtils
+    from ai_stock.utils.math_utils import MathUtils
+
+
+def __getattr__(name: str) -> Any:
+    """首次访问公共接口时导入对应子模块"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 # 版本信息
 VERSION_INFO = {
@@ -147,21 +191,6 @@ def get_version_info() -> dict:
     return VERSION_INFO
 
 
-# 模块级别的配置
-import logging
-import os
-from pathlib import Path
-
-# 设置日志配置
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("ai_stock.log", encoding="utf-8"),
-    ],
-)
-
 # 创建主日志器
 logger = logging.getLogger("ai_stock")
 
@@ -170,11 +199,54 @@ DATA_DIR = Path.home() / ".ai_stock" / "data"
 CONFIG_DIR = Path.home() / ".ai_stock" / "config"
 LOGS_DIR = Path.home() / ".ai_stock" / "logs"
 
-# 确保目录存在
-for directory in [DATA_DIR, CONFIG_DIR, LOGS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+_runtime_initialized = False
+
+
+def _ensure_runtime() -> None:
+    """
+    初始化运行环境：日志配置和数据目录
+    
+    仅由命令行入口等需要运行环境的地方调用，导入包本身不产生副作用。
+    重复调用不会重复初始化。
+    """
+    global _runtime_initialized
+    if _runtime_initialized:
+        return
+    _runtime_initialized = True
+    
+    # 确保目录存在
+    for directory in [DATA_DIR, CONFIG_DIR, LOGS_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
+    
+    # 设置日志配置，日志文件在首次写入时才打开
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(),
+            RotatingFileHandler(
+                LOGS_DIR / "ai_stock.log",
+                maxBytes=10_000_000,
+                backupCount=5,
+                encoding="utf-8",
+                delay=True,
+            ),
+        ],
+    )
+    
+    logger.info(f"AI Stock Trading System v{__version__} 初始化完成")
+    logger.info(f"数据目录: {DATA_DIR}")
+    logger.info(f"配置目录: {CONFIG_DIR}")
+    logger.info(f"日志目录: {LOGS_DIR}")
+
 
-logger.info(f"AI Stock Trading System v{__version__} 初始化完成")
-logger.info(f"数据目录: {DATA_DIR}")
-logger.info(f"配置目录: {CONFIG_DIR}")
-logger.info(f"日志目录: {LOGS_DIR}")
\ No newline at end of file
+def _init_worker_logging() -> None:
+    """
+    工作进程日志初始化（由 _run_single_trial 在工作进程中尚未配置日志时调用）
+    
+    工作进程只安装 NullHandler，避免多个进程争用同一日志文件或重复输出。
+    """
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.NullHandler())
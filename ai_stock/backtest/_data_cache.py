@@ -0,0 +1,73 @@
+# 历史K线磁盘缓存（Python版）
+# 按 (symbol, interval, start_ts, end_ts) 缓存，参数优化的多次回测/多个工作进程共享同一份数据
+# K线以列式 parquet 字节存入 diskcache；未安装 diskcache/pyarrow 时直接调用加载函数
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+from ai_stock import DATA_DIR
+from ai_stock.types import Kline
+
+try:
+    import diskcache
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    DISK_CACHE_AVAILABLE = True
+except ImportError:
+    DISK_CACHE_AVAILABLE = False
+
+KlineLoader = Callable[[str, str, int, int], List[Kline]]
+
+KLINE_CACHE_DIR = DATA_DIR / 'klines'
+DEFAULT_EXPIRE = 86400  # 秒
+CACHE_FORMAT_VERSION = 2  # 列格式变化时递增，旧格式的缓存项不再命中并随过期时间清除
+
+# 与 Kline 字段一一对应（symbol 除外，由缓存键给出）；可选字段允许为空
+_INT_COLUMNS = ('openTime', 'closeTime')
+_FLOAT_COLUMNS = (
+    'open', 'high', 'low', 'close', 'volume', 'quoteVolume', 'takerBuyBaseVolume', 'takerBuyQuoteVolume'
+)
+_BOOL_COLUMNS = ('ignore',)
+_COLUMNS = _INT_COLUMNS + _FLOAT_COLUMNS + _BOOL_COLUMNS
+
+
+def _klines_to_parquet(klines: List[Kline]) -> bytes:
+    columns = {name: [getattr(k, name) for k in klines] for name in _COLUMNS}
+    schema = pa.schema(
+        [(name, pa.int64()) for name in _INT_COLUMNS]
+        + [(name, pa.float64()) for name in _FLOAT_COLUMNS]
+        + [(name, pa.bool_()) for name in _BOOL_COLUMNS]
+    )
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.table(columns, schema=schema), sink, compression='zstd')
+    return sink.getvalue().to_pybytes()
+
+
+def _parquet_to_klines(data: bytes, symbol: str) -> List[Kline]:
+    columns = pq.read_table(pa.BufferReader(data)).to_pydict()
+    return [
+        Kline(symbol=symbol, **dict(zip(_COLUMNS, row)))
+        for row in zip(*(columns[name] for name in _COLUMNS))
+    ]
+
+
+class KlineDataCache:
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, expire: int = DEFAULT_EXPIRE):
+        self.expire = expire
+        self.cache = diskcache.Cache(str(cache_dir or KLINE_CACHE_DIR)) if DISK_CACHE_AVAILABLE else None
+
+    def load_klines(self, symbol: str, interval: str, start_ts: int, end_ts: int, loader: KlineLoader) -> List[Kline]:
+        """读取缓存的K线，未命中时调用 loader 加载并写入缓存"""
+        if self.cache is None:
+            return loader(symbol, interval, start_ts, end_ts)
+
+        key = (CACHE_FORMAT_VERSION, symbol, interval, start_ts, end_ts)
+        data = self.cache.get(key)
+        if data is not None:
+            return _parquet_to_klines(data, symbol)
+
+        klines = loader(symbol, interval, start_ts, end_ts)
+        self.cache.set(key, _klines_to_parquet(klines), expire=self.expire)
+        return klines
+
+    def clear(self):
+        if self.cache is not None:
+            self.cache.clear()
@@ -0,0 +1,86 @@
+# 回测逐 K 线撮合内核（Python版）
+# 输入输出均为连续的 NumPy 基本类型数组，安装 numba 时 JIT 编译，否则按纯 Python 执行
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def _simulate(
+    opens: np.ndarray,
+    closes: np.ndarray,
+    signals: np.ndarray,
+    commission: float,
+    initial_capital: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    单品种全仓做多撮合：第 i 根 K 线的信号（1 买入 / -1 卖出 / 0 持有）在第 i+1 根开盘价成交，
+    期末持仓按最后收盘价平仓。
+
+    返回:
+        equity: 每根 K 线收盘权益 (n,)
+        trade_idx: 每笔交易的开仓/平仓 K 线下标及平仓方式 (k, 3)；第 3 列为 1 表示期末按收盘价平仓，
+            为 0 表示按信号在开盘价平仓
+        trade_fills: 每笔交易的开仓价/平仓价/数量 (k, 3)
+        trade_pnl: 每笔交易的净盈亏（已扣手续费）(k,)
+    """
+    n = closes.shape[0]
+    equity = np.empty(n, dtype=np.float64)
+    trade_idx = np.empty((n, 3), dtype=np.int64)
+    trade_fills = np.empty((n, 3), dtype=np.float64)
+    trade_pnl = np.empty(n, dtype=np.float64)
+    n_trades = 0
+
+    cash = initial_capital
+    quantity = 0.0
+    entry_idx = -1
+    entry_price = 0.0
+    entry_cost = 0.0
+    pending = 0
+
+    for i in range(n):
+        if pending > 0 and quantity == 0.0:
+            entry_price = opens[i]
+            quantity = cash / (entry_price * (1.0 + commission))
+            entry_cost = cash
+            entry_idx = i
+            cash = 0.0
+        elif pending < 0 and quantity > 0.0:
+            exit_price = opens[i]
+            cash = quantity * exit_price * (1.0 - commission)
+            trade_idx[n_trades, 0] = entry_idx
+            trade_idx[n_trades, 1] = i
+            trade_idx[n_trades, 2] = 0
+            trade_fills[n_trades, 0] = entry_price
+            trade_fills[n_trades, 1] = exit_price
+            trade_fills[n_trades, 2] = quantity
+            trade_pnl[n_trades] = cash - entry_cost
+            n_trades += 1
+            quantity = 0.0
+        pending = signals[i]
+        equity[i] = cash + quantity * closes[i]
+
+    if quantity > 0.0:
+        exit_price = closes[n - 1]
+        cash = quantity * exit_price * (1.0 - commission)
+        trade_idx[n_trades, 0] = entry_idx
+        trade_idx[n_trades, 1] = n - 1
+        trade_idx[n_trades, 2] = 1
+        trade_fills[n_trades, 0] = entry_price
+        trade_fills[n_trades, 1] = exit_price
+        trade_fills[n_trades, 2] = quantity
+        trade_pnl[n_trades] = cash - entry_cost
+        n_trades += 1
+        equity[n - 1] = cash
+
+    return equity, trade_idx[:n_trades], trade_fills[:n_trades], trade_pnl[:n_trades]
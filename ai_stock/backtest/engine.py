@@ -1,24 +1,33 @@
 # 回测引擎（Python版）
+from enum import IntEnum
 from typing import List, Dict, Optional, Callable, Any
 from ai_stock.types import BacktestConfig, Signal, MarketData, Kline, BacktestResult, EquityPoint, Trade
 from ai_stock.utils import MathUtils
+from ai_stock.backtest._engine_loop import _simulate
+import numpy as np
 import time
 
-class OrderSide:
-    BUY = 'BUY'
-    SELL = 'SELL'
+class OrderSide(IntEnum):
+    BUY = 0
+    SELL = 1
 
-class OrderType:
-    MARKET = 'MARKET'
-    LIMIT = 'LIMIT'
+class OrderType(IntEnum):
+    MARKET = 0
+    LIMIT = 1
 
-class OrderStatus:
-    PENDING = 'PENDING'
-    FILLED = 'FILLED'
-    CANCELLED = 'CANCELLED'
+class OrderStatus(IntEnum):
+    PENDING = 0
+    FILLED = 1
+    CANCELLED = 2
 
 class Order:
-    def __init__(self, id: str, symbol: str, side: str, type: str, quantity: float, price: Optional[float], status: str, created_at: int, updated_at: int):
+    # 使用 __slots__ 去掉实例 __dict__，大量订单时降低内存占用、加快属性访问
+    __slots__ = (
+        'id', 'symbol', 'side', 'type', 'quantity', 'price', 'status',
+        'created_at', 'updated_at', 'filled_quantity', 'avg_price',
+    )
+
+    def __init__(self, id: str, symbol: str, side: OrderSide, type: OrderType, quantity: float, price: Optional[float], status: OrderStatus, created_at: int, updated_at: int, filled_quantity: Optional[float] = None, avg_price: Optional[float] = None):
         self.id = id
         self.symbol = symbol
         self.side = side
@@ -28,8 +37,14 @@ class Order:
         self.status = status
         self.created_at = created_at
         self.updated_at = updated_at
-        self.filled_quantity: Optional[float] = None
-        self.avg_price: Optional[float] = None
+        self.filled_quantity = filled_quantity
+        self.avg_price = avg_price
+
+    def __repr__(self) -> str:
+        return (
+            f'Order(id={self.id!r}, symbol={self.symbol!r}, side={self.side.name}, type={self.type.name}, '
+            f'quantity={self.quantity}, price={self.price}, status={self.status.name})'
+        )
 
 class BacktestError(Exception):
     def __init__(self, message: str, original_error: Optional[Exception] = None):
@@ -51,19 +66,129 @@ class BacktestEngine:
         self.account = None
         self.trades: List[Trade] = []
         self.orders: List[Order] = []
-        self.equity_curve: List[EquityPoint] = []
+        self.equity_times: np.ndarray = np.empty(0, dtype='int64')
+        self.equity_values: np.ndarray = np.empty(0, dtype='float64')
+        self.equity_drawdowns: np.ndarray = np.empty(0, dtype='float64')
+        self.peak_equity = 0.0
         self.current_bar = 0
         self.start_time = 0
         self.on_progress_callback: Optional[Callable[[Any], None]] = None
         self.reset_state()
 
-    def reset_state(self):
+    def reset_state(self, n_bars: int = 0):
         self.trades = []
         self.orders = []
-        self.equity_curve = []
+        # 权益曲线按列存储，按 K 线数量预分配，逐 K 线按 current_bar 下标写入
+        self.equity_times = np.empty(n_bars, dtype='int64')
+        self.equity_values = np.empty(n_bars, dtype='float64')
+        self.equity_drawdowns = np.empty(n_bars, dtype='float64')
+        self.peak_equity = 0.0
         self.current_bar = 0
         self.account = None
         self.strategy = None
 
+    def record_equity(self, timestamp: int, equity: float):
+        """记录当前 K 线（current_bar）的权益及回撤，由主循环在推进 current_bar 前调用"""
+        i = self.current_bar
+        if equity > self.peak_equity:
+            self.peak_equity = equity
+        self.equity_times[i] = timestamp
+        self.equity_values[i] = equity
+        self.equity_drawdowns[i] = (self.peak_equity - equity) / self.peak_equity if self.peak_equity > 0 else 0.0
+
+    def as_equity_points(self) -> List[EquityPoint]:
+        """将已记录的权益曲线转换为 EquityPoint 列表（供外部接口使用）"""
+        n = self.current_bar
+        return [
+            EquityPoint(time=t, equity=e, timestamp=t)
+            for t, e in zip(self.equity_times[:n].tolist(), self.equity_values[:n].tolist())
+        ]
+
+    def calculate_period_returns(self) -> np.ndarray:
+        """逐 K 线收益率序列"""
+        values = self.equity_values[:self.current_bar]
+        if len(values) < 2:
+            return np.empty(0, dtype='float64')
+        return values[1:] / values[:-1] - 1
+
+    def calculate_max_drawdown(self) -> float:
+        """最大回撤（比例）"""
+        if self.current_bar == 0:
+            return 0.0
+        return float(self.equity_drawdowns[:self.current_bar].max())
+
+    def calculate_sharpe_ratio(self, risk_free_rate: float = 0.0, periods_per_year: int = 252) -> float:
+        """年化夏普比率"""
+        returns = self.calculate_period_returns()
+        if len(returns) < 2:
+            return 0.0
+        std = returns.std()
+        if std == 0:
+            return 0.0
+        excess = returns.mean() - risk_free_rate / periods_per_year
+        return float(excess / std * np.sqrt(periods_per_year))
+
+    def execute_backtest(self, klines: List[Kline], signals: np.ndarray) -> List[Trade]:
+        """
+        执行逐 K 线回测
+
+        Args:
+            klines: 按时间排序的 K 线
+            signals: 与 klines 等长的信号数组（1 买入 / -1 卖出 / 0 持有）
+
+        Returns:
+            成交的交易列表
+        """
+        if self.config is None:
+            raise BacktestError('回测配置未设置')
+        if len(signals) != len(klines):
+            raise BacktestError('信号数量与K线数量不一致')
+
+        n = len(klines)
+        self.reset_state(n)
+        self.state = BacktestState.RUNNING
+        try:
+            opens = np.fromiter((k.open for k in klines), dtype='float64', count=n)
+            closes = np.fromiter((k.close for k in klines), dtype='float64', count=n)
+            self.equity_times[:] = np.fromiter((k.closeTime for k in klines), dtype='int64', count=n)
+            equity, trade_idx, trade_fills, trade_pnl = _simulate(
+                opens, closes, np.ascontiguousarray(signals, dtype='int64'),
+                float(self.config.commission), float(self.config.initialCapital)
+            )
+        except Exception as e:
+            self.state = BacktestState.ERROR
+            raise BacktestError(f'回测执行失败: {e}', e)
+
+        self.equity_values[:] = equity
+        if n:
+            peaks = np.maximum.accumulate(equity)
+            self.equity_drawdowns[:] = np.where(peaks > 0, (peaks - equity) / peaks, 0.0)
+            self.peak_equity = float(peaks[-1])
+        self.current_bar = n
+
+        # 仅在边界处重建 Trade 对象
+        symbol = klines[0].symbol if klines else ''
+        for (entry_i, exit_i, exit_at_close), (entry_price, exit_price, quantity), pnl in zip(
+            trade_idx.tolist(), trade_fills.tolist(), trade_pnl.tolist()
+        ):
+            cost = entry_price * quantity
+            self.trades.append(Trade(
+                id=f'{symbol}_{klines[entry_i].openTime}',
+                symbol=symbol,
+                entryTime=klines[entry_i].openTime,
+                # 信号平仓在开盘价成交，只有期末强制平仓按收盘价
+                exitTime=klines[exit_i].closeTime if exit_at_close else klines[exit_i].openTime,
+                entryPrice=entry_price,
+                exitPrice=exit_price,
+                volume=quantity,
+                pnl=pnl,
+                pnlPercent=pnl / cost if cost else 0.0,
+                quantity=quantity,
+                side=OrderSide.BUY.name,
+            ))
+
+        self.state = BacktestState.COMPLETED
+        return self.trades
+
     # 其余方法（run、pause、resume、stop、validate_config、initialize_strategy、initialize_account、load_historical_data、execute_backtest、calculate_results、等）
     # 可按 TypeScript 逻辑逐步迁移为 Python 方法，类型安全、中文注释 
\ No newline at end of file
@@ -2,6 +2,7 @@
 from typing import List, Dict, Any, Optional
 from ai_stock.backtest.engine import BacktestEngine, BacktestError
 from ai_stock.backtest.report_generator import BacktestReportGenerator, ReportConfig
+from ai_stock.backtest._data_cache import KlineDataCache, KlineLoader
 from ai_stock.types import BacktestConfig, BacktestResult, Trade, Kline
 from ai_stock.utils import DateUtils
 import time
@@ -25,8 +26,18 @@ class BacktestTaskResult:
         self.execution = execution
 
 class HistoricalBacktestRunner:
-    def __init__(self):
-        pass  # 数据采集与存储可后续补充
+    def __init__(self, data_loader: Optional[KlineLoader] = None, data_cache: Optional[KlineDataCache] = None):
+        # data_loader(symbol, interval, start_ts, end_ts) 负责实际获取K线，结果经磁盘缓存复用
+        self.data_loader = data_loader
+        # 未传入时在首次加载数据时创建，避免未使用缓存的执行器也打开磁盘缓存
+        self.data_cache = data_cache
+
+    def load_historical_data(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> List[Kline]:
+        if self.data_loader is None:
+            raise BacktestError('未配置历史数据加载器')
+        if self.data_cache is None:
+            self.data_cache = KlineDataCache()
+        return self.data_cache.load_klines(symbol, interval, start_ts, end_ts, self.data_loader)
 
     def run_historical_backtest(self, config: HistoricalBacktestConfig) -> BacktestTaskResult:
         start_time = time.time()
@@ -6,12 +6,32 @@ AI Stock Trading System - 命令行界面模块
 提供命令行工具和脚本功能。
 """
 
+import importlib
+
 from ai_stock.cli.main import main
-from ai_stock.cli.backtest import main as backtest_main
-from ai_stock.cli.monitor import main as monitor_main
+
+# 回测/监控命令行依赖较重（joblib、数据采集器等），首次访问时才导入
+_LAZY_IMPORTS = {
+    "backtest_main": ("ai_stock.cli.backtest", "main"),
+    "monitor_main": ("ai_stock.cli.monitor", "main"),
+}
 
 __all__ = [
     "main",
-    "backtest_main", 
+    "backtest_main",
     "monitor_main",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
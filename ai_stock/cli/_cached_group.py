@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Stock Trading System - 带缓存的 Click 命令组
+
+命令的选项解析器只构建一次，之后每次调用只重新绑定上下文；
+命令组的排序后命令列表在添加命令时失效。LazyGroup 的子命令在首次使用时才导入其所在模块。
+"""
+
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+
+class _ParserCacheMixin:
+    """缓存 make_parser() 的结果（按帮助选项名区分）"""
+
+    def make_parser(self, ctx: click.Context):
+        cache: Dict[Tuple[str, ...], object] = self.__dict__.setdefault("_parser_cache", {})
+        key = tuple(ctx.help_option_names)
+        parser = cache.get(key)
+        if parser is None:
+            parser = cache[key] = super().make_parser(ctx)
+        # 解析器的其余状态只与参数定义有关，每次调用只需绑定当前上下文
+        parser.ctx = ctx
+        parser.allow_interspersed_args = ctx.allow_interspersed_args
+        parser.ignore_unknown_options = ctx.ignore_unknown_options
+        return parser
+
+
+class CachedCommand(_ParserCacheMixin, click.Command):
+    """缓存选项解析器的命令"""
+
+
+class CachedGroup(_ParserCacheMixin, click.Group):
+    """缓存选项解析器和命令列表的命令组，子命令和子命令组同样使用缓存版本"""
+
+    command_class = CachedCommand
+    group_class = type
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._sorted_commands: Optional[List[str]] = None
+
+    def add_command(self, cmd: click.Command, name: Optional[str] = None) -> None:
+        super().add_command(cmd, name)
+        self._sorted_commands = None
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        if self._sorted_commands is None:
+            self._sorted_commands = sorted(self.commands)
+        return list(self._sorted_commands)
+
+
+class LazyGroup(CachedGroup):
+    """
+    按需导入子命令的命令组
+    
+    lazy_subcommands 为 {命令名: 模块路径}，模块中与命令同名的对象即为该命令；
+    只有被调用（或显示帮助）的子命令才会导入对应模块。
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module = importlib.import_module(self.lazy_subcommands[cmd_name])
+            self.add_command(getattr(module, cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Stock Trading System - 监控命令行工具：history 子命令
+
+查看信号历史。
+"""
+
+import click
+import numpy as np
+import sys
+import json
+from typing import Optional
+
+from ai_stock.cli._cached_group import CachedCommand
+from ai_stock.cli.monitor import display_signal_history, generate_mock_signal_history
+from ai_stock.utils.json_utils import JsonUtils
+
+
+@click.command(cls=CachedCommand)
+@click.option(
+    "--file", "-f",
+    type=click.Path(exists=True),
+    help="信号日志文件路径"
+)
+@click.option(
+    "--symbol",
+    help="过滤特定交易对"
+)
+@click.option(
+    "--side",
+    type=click.Choice(["BUY", "SELL"], case_sensitive=False),
+    help="过滤交易方向"
+)
+@click.option(
+    "--min-confidence",
+    type=float,
+    help="最小置信度过滤"
+)
+@click.option(
+    "--limit", "-n",
+    type=int,
+    default=50,
+    help="显示数量限制"
+)
+@click.pass_context
+def history(
+    ctx: click.Context,
+    file: Optional[str],
+    symbol: Optional[str],
+    side: Optional[str],
+    min_confidence: Optional[float],
+    limit: int
+):
+    """查看信号历史"""
+    click.echo("📋 信号历史查询")
+    
+    try:
+        if file:
+            # 从文件读取信号历史
+            with open(file, 'rb') as f:
+                signal_data = []
+                for line in f:
+                    try:
+                        signal_json = JsonUtils.loads(line)
+                        signal_data.append(signal_json)
+                    except json.JSONDecodeError:
+                        continue
+        else:
+            # 模拟一些历史信号
+            signal_data = generate_mock_signal_history()
+        
+        # 应用过滤器：各字段转成列数组后用布尔掩码一次筛选
+        n = len(signal_data)
+        mask = np.ones(n, dtype=bool)
+        
+        if symbol:
+            symbols = np.array([s.get("symbol", "").upper() for s in signal_data], dtype=str)
+            mask &= symbols == symbol.upper()
+        
+        if side:
+            sides = np.array([s.get("side", "").upper() for s in signal_data], dtype=str)
+            mask &= sides == side.upper()
+        
+        if min_confidence is not None:
+            confidences = np.fromiter((s.get("confidence", 0) for s in signal_data), dtype=np.float64, count=n)
+            mask &= confidences >= min_confidence
+        
+        # 按时间倒序排序（稳定排序，时间相同的保持原有顺序）并限制数量
+        selected = np.flatnonzero(mask)
+        timestamps = np.fromiter((signal_data[i].get("timestamp", 0) for i in selected), dtype=np.float64, count=len(selected))
+        order = selected[np.argsort(-timestamps, kind="stable")[:limit]]
+        filtered_signals = [signal_data[i] for i in order]
+        
+        # 显示结果
+        display_signal_history(filtered_signals)
+        
+    except Exception as e:
+        click.echo(f"❌ 历史查询失败: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Stock Trading System - 监控命令行工具：prices 子命令
+
+实时价格监控。
+"""
+
+import asyncio
+import click
+import sys
+from operator import itemgetter
+from typing import Optional
+
+from ai_stock.cli._cached_group import CachedCommand
+from ai_stock.cli.monitor import (
+    display_price_table, run_monitor, create_collector, install_shutdown_handlers, wait_for_stop
+)
+
+# --sort-by 选项对应的排序键
+_SORT_KEYS = {
+    "price": itemgetter("price"),
+    "volume": itemgetter("volume"),
+    "change": itemgetter("change_24h"),
+}
+
+
+@click.command(cls=CachedCommand)
+@click.option(
+    "--source", "-s",
+    type=click.Choice(["binance", "yfinance"], case_sensitive=False),
+    default="binance",
+    help="数据源选择"
+)
+@click.option(
+    "--symbols",
+    help="交易对列表，逗号分隔（为空时显示所有）"
+)
+@click.option(
+    "--sort-by",
+    type=click.Choice(["price", "volume", "change"], case_sensitive=False),
+    default="change",
+    help="排序方式"
+)
+@click.option(
+    "--limit", "-n",
+    type=int,
+    default=20,
+    help="显示数量限制"
+)
+@click.option(
+    "--refresh",
+    type=int,
+    default=10,
+    help="刷新间隔（秒）"
+)
+@click.pass_context
+def prices(
+    ctx: click.Context,
+    source: str,
+    symbols: Optional[str],
+    sort_by: str,
+    limit: int,
+    refresh: int
+):
+    """实时价格监控"""
+    click.echo("💹 启动价格监控...")
+    click.echo(f"数据源: {source}")
+    click.echo(f"排序: {sort_by}")
+    click.echo(f"刷新间隔: {refresh}秒")
+    click.echo("按 Ctrl+C 停止")
+    click.echo("=" * 80)
+    
+    sort_key = _SORT_KEYS[sort_by]
+    
+    async def monitor_prices():
+        try:
+            # 创建数据采集器（按需导入）
+            collector = create_collector(source)
+            
+            await collector.start()
+            
+            # 获取交易对列表
+            if symbols:
+                symbol_list = [s.strip().upper() for s in symbols.split(",")]
+            else:
+                # 使用默认的热门交易对
+                if source == "binance":
+                    symbol_list = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "SOLUSDT"]
+                else:
+                    symbol_list = ["AAPL", "GOOGL", "MSFT", "TSLA", "AMZN"]
+            
+            stop_event = install_shutdown_handlers("\n🛑 停止价格监控...")
+            
+            while not stop_event.is_set():
+                try:
+                    # 并发获取所有价格数据
+                    display_symbols = symbol_list[:limit]
+                    tickers = await asyncio.gather(
+                        *(collector.get_ticker(symbol) for symbol in display_symbols),
+                        return_exceptions=True
+                    )
+                    
+                    price_data = []
+                    for symbol, ticker in zip(display_symbols, tickers):
+                        if isinstance(ticker, Exception):
+                            click.echo(f"⚠️ 获取 {symbol} 价格失败: {ticker}")
+                            continue
+                        price_data.append({
+                            "symbol": ticker.symbol,
+                            "price": ticker.price,
+                            "change_24h": ticker.change_percent_24h,
+                            "volume": ticker.volume,
+                            "high": ticker.high_price,
+                            "low": ticker.low_price
+                        })
+                    
+                    # 排序
+                    price_data.sort(key=sort_key, reverse=True)
+                    
+                    # 显示价格表格
+                    display_price_table(price_data)
+                    
+                    # 等待刷新
+                    await wait_for_stop(stop_event, refresh)
+                except Exception as e:
+                    click.echo(f"❌ 价格监控错误: {e}")
+                    await wait_for_stop(stop_event, 5)
+            
+            await collector.stop()
+            
+        except Exception as e:
+            click.echo(f"❌ 价格监控启动失败: {e}", err=True)
+            sys.exit(1)
+    
+    run_monitor(monitor_prices())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Stock Trading System - 监控命令行工具：status 子命令
+
+显示监控状态。
+"""
+
+import click
+from datetime import datetime, timedelta
+
+from ai_stock.cli._cached_group import CachedCommand
+from ai_stock.cli.monitor import format_duration
+
+
+@click.command(cls=CachedCommand)
+@click.pass_context
+def status(ctx: click.Context):
+    """显示监控状态"""
+    state = ctx.obj["state"]
+    
+    click.echo("📊 监控状态")
+    click.echo("=" * 40)
+    
+    if state.running:
+        click.echo("🟢 状态: 运行中")
+        uptime = datetime.now() - state.start_time if state.start_time else timedelta(0)
+        click.echo(f"⏱️ 运行时间: {format_duration(uptime)}")
+    else:
+        click.echo("🔴 状态: 已停止")
+    
+    click.echo(f"📈 生成信号数: {state.signals_generated}")
+    click.echo(f"✅ 有效信号数: {state.signals_filtered}")
+    click.echo(f"🎯 活跃信号数: {len(state.active_signals)}")
+    
+    if state.last_update:
+        click.echo(f"🔄 最后更新: {state.last_update.strftime('%H:%M:%S')}")
+    
+    if state.error_count:
+        click.echo(f"❌ 错误数量: {state.error_count}")
+        if ctx.obj.get("verbose"):
+            click.echo("最近错误:")
+            for error in state.recent_errors(5):
+                click.echo(f"  • {error}")
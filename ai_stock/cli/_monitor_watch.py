@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Stock Trading System - 监控命令行工具：watch 子命令
+
+实时监控交易信号。
+"""
+
+import asyncio
+import click
+import sys
+import time
+from datetime import datetime
+from typing import Optional
+
+from ai_stock.cli._cached_group import CachedCommand
+from ai_stock.cli.monitor import (
+    handle_new_signal, display_monitor_status, flush_signal_writers, close_signal_writers,
+    run_monitor, create_collector, install_shutdown_handlers, wait_for_stop
+)
+
+# K线周期单位对应的秒数
+_INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+# 监控循环出错后的重试等待（秒）
+ERROR_RETRY_DELAY = 10
+
+
+def _interval_seconds(interval: str) -> Optional[int]:
+    """把 1m/15m/1h/1d 等K线周期转换为秒，无法识别时返回 None"""
+    unit = _INTERVAL_UNITS.get(interval[-1:])
+    if unit is None or not interval[:-1].isdigit():
+        return None
+    return int(interval[:-1]) * unit
+
+
+def _seconds_until_next(now: float, period: float) -> float:
+    """距离下一个 period 整数倍时刻的秒数"""
+    return period - now % period
+
+
+@click.command(cls=CachedCommand)
+@click.option(
+    "--source", "-s",
+    type=click.Choice(["binance", "yfinance"], case_sensitive=False),
+    default="binance",
+    help="数据源选择"
+)
+@click.option(
+    "--symbols",
+    required=True,
+    help="监控的交易对，逗号分隔"
+)
+@click.option(
+    "--interval", "-i",
+    default="1m",
+    help="监控间隔"
+)
+@click.option(
+    "--update-frequency",
+    type=int,
+    default=60,
+    help="更新频率（秒）"
+)
+@click.option(
+    "--alert-file",
+    type=click.Path(),
+    help="报警输出文件"
+)
+@click.option(
+    "--log-signals",
+    is_flag=True,
+    help="记录所有信号到文件"
+)
+@click.pass_context
+def watch(
+    ctx: click.Context,
+    source: str,
+    symbols: str,
+    interval: str,
+    update_frequency: int,
+    alert_file: Optional[str],
+    log_signals: bool
+):
+    """实时监控交易信号"""
+    symbol_list = [s.strip().upper() for s in symbols.split(",")]
+    state = ctx.obj["state"]
+    
+    click.echo("👀 启动实时监控...")
+    click.echo(f"数据源: {source}")
+    click.echo(f"监控交易对: {', '.join(symbol_list)}")
+    click.echo(f"监控间隔: {interval}")
+    click.echo(f"更新频率: {update_frequency}秒")
+    click.echo("按 Ctrl+C 停止监控")
+    click.echo("=" * 60)
+    
+    async def monitor_signals():
+        try:
+            from ai_stock.signals.generators.trading_signal_generator import TradingSignalGenerator
+            from ai_stock.signals.filters.signal_filter import SignalFilter
+            
+            # 创建数据采集器（按需导入）
+            collector = create_collector(source)
+            
+            await collector.start()
+            
+            # 创建信号生成器和过滤器
+            signal_generator = TradingSignalGenerator()
+            signal_filter = SignalFilter()
+            
+            state.running = True
+            state.start_time = datetime.now()
+            
+            # 循环在K线收盘/状态显示时刻醒来，停止信号通过事件立即唤醒
+            kline_seconds = _interval_seconds(interval)
+            stop_event = install_shutdown_handlers("\n🛑 收到停止信号，正在关闭监控...")
+            
+            last_display_time = 0
+            
+            while not stop_event.is_set():
+                try:
+                    current_time = time.time()
+                    
+                    # 并发获取所有交易对的数据
+                    results = await asyncio.gather(
+                        *(collector.get_market_data(symbol, interval, 100) for symbol in symbol_list),
+                        return_exceptions=True
+                    )
+                    
+                    for symbol, market_data in zip(symbol_list, results):
+                        try:
+                            if isinstance(market_data, Exception):
+                                raise market_data
+                            
+                            # 生成信号
+                            signals = signal_generator.generate_signals(market_data)
+                            state.signals_generated += len(signals)
+                            
+                            # 过滤信号
+                            filtered_signals = signal_filter.filter_signals(signals)
+                            state.signals_filtered += len(filtered_signals)
+                            
+                            # 处理新信号
+                            for new_signal in filtered_signals:
+                                await handle_new_signal(new_signal, alert_file, log_signals)
+                                state.add_signal(new_signal)
+                            
+                        except Exception as e:
+                            error_msg = f"处理 {symbol} 时出错: {e}"
+                            state.record_error(error_msg)
+                            click.echo(f"⚠️ {error_msg}")
+                    
+                    # 清理过期信号（1小时内的信号保留）
+                    state.expire_signals(current_time)
+                    flush_signal_writers()
+                    
+                    state.last_update = datetime.now()
+                    
+                    # 定期显示状态
+                    if current_time - last_display_time >= update_frequency:
+                        display_monitor_status(state, symbol_list, now=state.last_update)
+                        last_display_time = current_time
+                    
+                    # 等到下一根K线收盘或下一次状态显示
+                    now = time.time()
+                    wake_periods = [p for p in (kline_seconds, update_frequency) if p]
+                    sleep_for = min(_seconds_until_next(now, p) for p in wake_periods) if wake_periods else 5
+                    await wait_for_stop(stop_event, sleep_for)
+                    
+                except Exception as e:
+                    error_msg = f"监控循环出错: {e}"
+                    state.record_error(error_msg)
+                    click.echo(f"❌ {error_msg}")
+                    await wait_for_stop(stop_event, ERROR_RETRY_DELAY)  # 出错后等待更长时间
+            
+            state.running = False
+            await collector.stop()
+            close_signal_writers()
+            click.echo("✅ 监控已停止")
+            
+        except Exception as e:
+            click.echo(f"❌ 监控启动失败: {e}", err=True)
+            sys.exit(1)
+    
+    run_monitor(monitor_signals())
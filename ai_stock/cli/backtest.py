@@ -6,20 +6,44 @@ AI Stock Trading System - 回测命令行工具
 提供策略回测功能的命令行界面。
 """
 
-import asyncio
 import click
+import itertools
+import logging
 import sys
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 import json
 from datetime import datetime, timedelta
 
-from ai_stock import __version__
+import numpy as np
+from joblib import Parallel, delayed
+
+from ai_stock import __version__, _ensure_runtime, _init_worker_logging
 from ai_stock.core.types import BacktestConfig, StrategyConfig
 from ai_stock.utils.config_utils import ConfigUtils
 from ai_stock.utils.logging_utils import setup_logger
 from ai_stock.utils.date_utils import DateUtils
 from ai_stock.utils.format_utils import FormatUtils
+from ai_stock.utils.json_utils import JsonUtils
+
+
+# 粗细两轮网格搜索参数
+OPTIMIZE_COARSE_POINTS = 4
+OPTIMIZE_FINE_POINTS = 5
+OPTIMIZE_TOP_K = 5
+
+# 文本图表柱条最长格数：每 2% 一格，收益率或回撤超过 256% 时柱条不再变长（百分比数值照常显示）
+BAR_MAX = 128
+# 预先生成的最长柱条，按长度切片使用
+_FULL_BAR = "█" * BAR_MAX
+_MED_BAR = "▓" * BAR_MAX
+_LIGHT_BAR = "░" * BAR_MAX
+
+# 逐行 JSON 结果文件后缀
+NDJSON_SUFFIX = ".ndjson"
+
+# 模拟结果使用的模块级随机数生成器，可通过 --seed 固定
+_RNG = np.random.default_rng()
 
 
 @click.group()
@@ -34,8 +58,13 @@ from ai_stock.utils.format_utils import FormatUtils
     is_flag=True,
     help="详细输出"
 )
+@click.option(
+    "--seed",
+    type=int,
+    help="随机数种子（用于复现模拟结果）"
+)
 @click.pass_context
-def backtest_cli(ctx: click.Context, config: Optional[str], verbose: bool):
+def backtest_cli(ctx: click.Context, config: Optional[str], verbose: bool, seed: Optional[int]):
     """
     AI Stock Trading System - 回测工具
     
@@ -43,6 +72,9 @@ def backtest_cli(ctx: click.Context, config: Optional[str], verbose: bool):
     """
     ctx.ensure_object(dict)
     
+    if seed is not None:
+        set_random_seed(seed)
+    
     # 设置日志
     log_level = "DEBUG" if verbose else "INFO"
     setup_logger("backtest", log_level=log_level)
@@ -122,7 +154,7 @@ def run(
     click.echo(f"时间范围: {start_date} 到 {end_date}")
     click.echo(f"初始资金: {FormatUtils.format_currency(initial_capital)}")
     click.echo(f"手续费率: {FormatUtils.format_percentage(commission)}")
-    async def run_backtest():
+    def run_backtest():
         try:
             # 解析策略参数
             strategy_params = {}
@@ -157,9 +189,6 @@ def run(
             # 由于回测引擎还没有实现，我们模拟一个简单的结果
             click.echo("⏳ 正在执行回测...")
             
-            # 模拟回测结果
-            await asyncio.sleep(2)  # 模拟处理时间
-            
             # 生成模拟结果
             result = generate_mock_backtest_result(
                 strategy, symbol, start_date, end_date, initial_capital
@@ -177,7 +206,7 @@ def run(
             click.echo(f"❌ 回测失败: {e}", err=True)
             sys.exit(1)
     
-    asyncio.run(run_backtest())
+    run_backtest()
 
 
 @backtest_cli.command()
@@ -220,9 +249,15 @@ def run(
 )
 @click.option(
     "--max-iterations",
-    type=int,
+    type=click.IntRange(min=1),
     default=100,
-    help="最大迭代次数"
+    help="每轮搜索最多评估的参数组合数"
+)
+@click.option(
+    "--n-jobs",
+    type=int,
+    default=-1,
+    help="并行进程数，-1 表示使用全部 CPU"
 )
 @click.option(
     "--output", "-o",
@@ -240,6 +275,7 @@ def optimize(
     initial_capital: float,
     metric: str,
     max_iterations: int,
+    n_jobs: int,
     output: Optional[str]
 ):
     """参数优化"""
@@ -249,8 +285,13 @@ def optimize(
     click.echo(f"优化指标: {metric}")
     click.echo(f"最大迭代: {max_iterations}")
     
-    async def run_optimization():
+    def run_optimization():
         try:
+            # 验证日期格式
+            if not DateUtils.validate_date_range(start_date, end_date):
+                click.echo("❌ 日期范围无效", err=True)
+                return
+            
             # 加载参数范围
             ranges_path = Path(param_ranges)
             if not ranges_path.exists():
@@ -258,28 +299,64 @@ def optimize(
                 return
             
             with open(ranges_path, 'r', encoding='utf-8') as f:
-                param_ranges_data = json.load(f)
+                param_ranges_data = JsonUtils.load(f)
             click.echo("⏳ 正在执行参数优化...")
             
-            # 模拟优化过程
-            best_params = {}
-            best_score = 0.0
+            param_names = list(param_ranges_data.keys())
+            if not param_names:
+                click.echo("❌ 参数范围为空", err=True)
+                return
+            for name in param_names:
+                error = _param_spec_error(param_ranges_data[name])
+                if error:
+                    click.echo(f"❌ 参数 {name} 的范围无效: {error}", err=True)
+                    return
+            
+            trial_args = (strategy, symbol, start_date, end_date, initial_capital)
+            scored_trials: List[Tuple[float, Dict[str, Any]]] = []
+            
+            # 各组参数相互独立，分发到 loky 进程池并行执行（两轮复用同一组工作进程）
+            with Parallel(
+                n_jobs=n_jobs, backend="loky", batch_size="auto", return_as="generator"
+            ) as parallel:
+                # 第一轮：粗网格，每个参数取少量等距（或对数等距）取值
+                coarse_grid = _build_param_grid(
+                    param_names,
+                    [_coarse_axis(param_ranges_data[name]) for name in param_names],
+                    max_iterations
+                )
+                scored_trials.extend(_evaluate_param_grid(
+                    parallel, coarse_grid, "粗搜索", metric, trial_args
+                ))
+                
+                # 第二轮：在排名前 K 的参数附近 ±1 个粗网格步长内细化
+                survivors = sorted(scored_trials, key=lambda x: x[0], reverse=True)[:OPTIMIZE_TOP_K]
+                evaluated = {_param_key(param_names, params) for _, params in scored_trials}
+                fine_grid: List[Dict[str, Any]] = []
+                for _, center in survivors:
+                    for params in _build_param_grid(
+                        param_names,
+                        [_fine_axis(param_ranges_data[name], center[name]) for name in param_names],
+                        max_iterations
+                    ):
+                        key = _param_key(param_names, params)
+                        if key not in evaluated:
+                            evaluated.add(key)
+                            fine_grid.append(params)
+                fine_grid = fine_grid[:max_iterations]
+                scored_trials.extend(_evaluate_param_grid(
+                    parallel, fine_grid, "精细搜索", metric, trial_args
+                ))
+            
+            if not scored_trials:
+                click.echo("❌ 没有可评估的参数组合", err=True)
+                return
+            best_score, best_params = max(scored_trials, key=lambda x: x[0])
             
-            for i in range(max_iterations):
-                if i % 10 == 0:
-                    progress = (i / max_iterations) * 100
-                    click.echo(f"进度: {progress:.1f}% ({i}/{max_iterations})")
-                await asyncio.sleep(0.01)  # 模拟计算时间
+            # 最大回撤越小越好，评分时取负，展示时还原
+            if metric == "max_drawdown":
+                best_score = -best_score
             
-            # 生成模拟的最优参数
-            best_params = {
-                "sma_short_period": 10,
-                "sma_long_period": 20,
-                "rsi_period": 14,
-                "rsi_oversold": 30,
-                "rsi_overbought": 70
-            }
-            best_score = 1.25  # 模拟夏普比率
             click.echo("✅ 参数优化完成!")
             click.echo(f"最优 {metric}: {best_score:.4f}")
             click.echo("最优参数:")
@@ -294,7 +371,7 @@ def optimize(
                     "optimization_metric": metric,
                     "best_score": best_score,
                     "best_parameters": best_params,
-                    "iterations": max_iterations,
+                    "iterations": len(scored_trials),
                     "timestamp": datetime.now().isoformat()
                 }
                 
@@ -302,14 +379,14 @@ def optimize(
                 output_path.parent.mkdir(parents=True, exist_ok=True)
                 
                 with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(optimization_result, f, indent=2, ensure_ascii=False)
+                    JsonUtils.dump(optimization_result, f)
                 
                 click.echo(f"📁 优化结果已保存到: {output}")
         except Exception as e:
             click.echo(f"❌ 参数优化失败: {e}", err=True)
             sys.exit(1)
     
-    asyncio.run(run_optimization())
+    run_optimization()
 
 
 @backtest_cli.command()
@@ -331,16 +408,21 @@ def analyze(ctx: click.Context, file: str, format: str):
     click.echo(f"📊 分析回测结果: {file}")
     
     try:
-        # 加载结果文件
-        with open(file, 'r', encoding='utf-8') as f:
-            result = json.load(f)
+        # 加载结果文件，NDJSON 文件每行一个结果
+        if Path(file).suffix.lower() == NDJSON_SUFFIX:
+            with open(file, 'rb') as f:
+                results = [JsonUtils.loads(line) for line in f if line.strip()]
+        else:
+            with open(file, 'r', encoding='utf-8') as f:
+                results = [JsonUtils.load(f)]
         
-        if format == "table":
-            display_result_table(result)
-        elif format == "chart":
-            display_result_chart(result)
-        elif format == "report":
-            generate_detailed_report(result)
+        for result in results:
+            if format == "table":
+                display_result_table(result)
+            elif format == "chart":
+                display_result_chart(result)
+            elif format == "report":
+                generate_detailed_report(result)
         
     except Exception as e:
         click.echo(f"❌ 结果分析失败: {e}", err=True)
@@ -377,7 +459,7 @@ def analyze(ctx: click.Context, file: str, format: str):
 @click.option(
     "--output", "-o",
     type=click.Path(),
-    help="比较结果输出文件"
+    help="比较结果输出文件（.ndjson 后缀时逐行输出每个策略结果）"
 )
 @click.pass_context
 def compare(
@@ -396,39 +478,47 @@ def compare(
     click.echo(f"交易对: {symbol}")
     click.echo(f"时间范围: {start_date} 到 {end_date}")
     
-    async def run_comparison():
+    def run_comparison():
         try:
-            comparison_results = []
+            # 验证日期格式
+            if not DateUtils.validate_date_range(start_date, end_date):
+                click.echo("❌ 日期范围无效", err=True)
+                return
             
-            for strategy in strategy_list:
-                click.echo(f"⏳ 回测策略: {strategy}")
-                
-                # 模拟每个策略的回测
-                result = generate_mock_backtest_result(
-                    strategy, symbol, start_date, end_date, initial_capital
-                )
-                comparison_results.append(result)
-                
-                await asyncio.sleep(1)  # 模拟处理时间
+            click.echo(f"⏳ 回测策略: {', '.join(strategy_list)}")
+            
+            # 一次性批量生成所有策略的回测结果
+            comparison_results = generate_mock_backtest_results_batch(
+                strategy_list, symbol, start_date, end_date, initial_capital
+            )
             
             # 显示比较表格
             display_strategy_comparison(comparison_results)
             
             # 保存比较结果
             if output:
-                comparison_data = {
+                comparison_meta = {
                     "comparison_date": datetime.now().isoformat(),
                     "symbol": symbol,
                     "period": f"{start_date} to {end_date}",
-                    "initial_capital": initial_capital,
-                    "strategies": comparison_results
+                    "initial_capital": initial_capital
                 }
                 
                 output_path = Path(output)
                 output_path.parent.mkdir(parents=True, exist_ok=True)
                 
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(comparison_data, f, indent=2, ensure_ascii=False, default=str)
+                if output_path.suffix.lower() == NDJSON_SUFFIX:
+                    # 逐行写入每个策略结果，元信息单独保存，避免构建完整文档
+                    meta_path = output_path.with_name(f"{output_path.stem}_meta.json")
+                    with open(meta_path, 'w', encoding='utf-8') as f:
+                        JsonUtils.dump(comparison_meta, f)
+                    with open(output_path, 'wb') as f:
+                        for result in comparison_results:
+                            f.write(JsonUtils.dumpb(result) + b"\n")
+                else:
+                    comparison_data = {**comparison_meta, "strategies": comparison_results}
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        JsonUtils.dump(comparison_data, f)
                 
                 click.echo(f"📁 比较结果已保存到: {output}")
             
@@ -436,7 +526,135 @@ def compare(
             click.echo(f"❌ 策略比较失败: {e}", err=True)
             sys.exit(1)
     
-    asyncio.run(run_comparison())
+    run_comparison()
+
+
+def _param_spec_error(spec: Any) -> Optional[str]:
+    """检查单个参数的范围定义，有效时返回 None，否则返回错误说明"""
+    if isinstance(spec, list):
+        return None if spec else "取值列表为空"
+    if not isinstance(spec, dict) or "min" not in spec or "max" not in spec:
+        return "须为取值列表或包含 min/max 的对象"
+    if spec["min"] > spec["max"]:
+        return "min 大于 max"
+    if spec.get("log_scale") and spec["min"] <= 0:
+        return "log_scale 要求 min > 0"
+    return None
+
+
+def _coarse_axis(spec: Any) -> List[Any]:
+    """
+    生成参数的粗网格取值
+    
+    Args:
+        spec: 参数范围 {"min", "max", "log_scale"}；也兼容直接给出的取值列表
+        
+    Returns:
+        取值列表
+    """
+    if isinstance(spec, list):
+        return spec
+    return _axis_values(spec, spec["min"], spec["max"], OPTIMIZE_COARSE_POINTS)
+
+
+def _fine_axis(spec: Any, center: Any) -> List[Any]:
+    """在粗网格取值 center 附近 ±1 个粗网格步长内生成细网格取值"""
+    if isinstance(spec, list):
+        return [center]
+    low, high = spec["min"], spec["max"]
+    if spec.get("log_scale"):
+        ratio = (high / low) ** (1 / (OPTIMIZE_COARSE_POINTS - 1))
+        lower, upper = center / ratio, center * ratio
+    else:
+        step = (high - low) / (OPTIMIZE_COARSE_POINTS - 1)
+        lower, upper = center - step, center + step
+    return _axis_values(spec, max(low, lower), min(high, upper), OPTIMIZE_FINE_POINTS)
+
+
+def _axis_values(spec: Dict[str, Any], low: float, high: float, num: int) -> List[Any]:
+    """按线性或对数刻度在 [low, high] 内生成 num 个取值，整数参数取整去重"""
+    if spec.get("log_scale"):
+        values = np.geomspace(low, high, num)
+    else:
+        values = np.linspace(low, high, num)
+    if isinstance(spec["min"], int) and isinstance(spec["max"], int):
+        return sorted({int(v) for v in np.rint(values)})
+    return [float(v) for v in values]
+
+
+def _build_param_grid(
+    param_names: List[str],
+    axes: List[List[Any]],
+    limit: int
+) -> List[Dict[str, Any]]:
+    """构建参数网格（笛卡尔积），最多 limit 组"""
+    return [
+        dict(zip(param_names, values))
+        for values in itertools.islice(itertools.product(*axes), limit)
+    ]
+
+
+def _param_key(param_names: List[str], params: Dict[str, Any]) -> Tuple[Any, ...]:
+    """参数组合的可哈希键，用于去重"""
+    return tuple(params[name] for name in param_names)
+
+
+def _evaluate_param_grid(
+    parallel: Parallel,
+    param_grid: List[Dict[str, Any]],
+    label: str,
+    metric: str,
+    trial_args: Tuple[Any, ...]
+) -> List[Tuple[float, Dict[str, Any]]]:
+    """并行评估参数网格，返回 (评分, 参数) 列表"""
+    if not param_grid:
+        return []
+    
+    # 为每组参数从主进程随机数生成器派生种子，使 --seed 对子进程同样生效
+    seeds = _RNG.integers(2**63, size=len(param_grid)).tolist()
+    results = parallel(
+        delayed(_run_single_trial)(params, *trial_args, seed=seed)
+        for params, seed in zip(param_grid, seeds)
+    )
+    scored = []
+    with click.progressbar(length=len(param_grid), label=label) as bar:
+        for params, result in zip(param_grid, results):
+            scored.append((_score_trial(result, metric), params))
+            bar.update(1)
+    return scored
+
+
+def _run_single_trial(
+    params: Dict[str, Any],
+    strategy: str,
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    initial_capital: float,
+    seed: Optional[int] = None
+) -> Dict[str, Any]:
+    """执行单组参数的回测（模块级函数，便于进程池序列化）"""
+    # 工作进程中未配置日志时只安装 NullHandler，避免争用日志文件
+    if not logging.getLogger().handlers:
+        _init_worker_logging()
+    result = generate_mock_backtest_results_batch(
+        [strategy], symbol, start_date, end_date, initial_capital,
+        rng=np.random.default_rng(seed)
+    )[0]
+    result["parameters"] = params
+    return result
+
+
+def _score_trial(result: Dict[str, Any], metric: str) -> float:
+    """计算优化评分，分数越高越好"""
+    value = result.get(metric, 0.0)
+    return -value if metric == "max_drawdown" else value
+
+
+def set_random_seed(seed: int) -> None:
+    """重新设置模拟结果的随机数种子"""
+    global _RNG
+    _RNG = np.random.default_rng(seed)
 
 
 def generate_mock_backtest_result(
@@ -447,33 +665,88 @@ def generate_mock_backtest_result(
     initial_capital: float
 ) -> Dict[str, Any]:
     """生成模拟回测结果"""
-    import random
+    return generate_mock_backtest_results_batch(
+        [strategy], symbol, start_date, end_date, initial_capital
+    )[0]
+
+
+def generate_mock_backtest_results_batch(
+    strategies: List[str],
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    initial_capital: float,
+    rng: Optional[np.random.Generator] = None
+) -> List[Dict[str, Any]]:
+    """
+    批量生成多个策略的模拟回测结果
+    
+    每个指标对所有策略一次性向量化采样，避免逐策略的标量随机数调用。
+    
+    Args:
+        strategies: 策略名称列表
+        symbol: 交易对符号
+        start_date: 开始日期
+        end_date: 结束日期
+        initial_capital: 初始资金
+        rng: 随机数生成器，默认使用模块级生成器
+        
+    Returns:
+        与 strategies 顺序一致的回测结果列表
+    """
+    rng = rng or _RNG
+    n = len(strategies)
+    
     # 模拟结果数据
-    total_return = random.uniform(-0.2, 0.5)  # -20% 到 50%
-    max_drawdown = random.uniform(0.05, 0.3)  # 5% 到 30%
-    sharpe_ratio = random.uniform(0.5, 2.5)
-    win_rate = random.uniform(0.4, 0.7)  # 40% 到 70%
-    total_trades = random.randint(50, 200)
+    total_return = rng.uniform(-0.2, 0.5, size=n)  # -20% 到 50%
+    max_drawdown = rng.uniform(0.05, 0.3, size=n)  # 5% 到 30%
+    sharpe_ratio = rng.uniform(0.5, 2.5, size=n)
+    win_rate = rng.uniform(0.4, 0.7, size=n)  # 40% 到 70%
+    total_trades = rng.integers(50, 200, size=n, endpoint=True)
+    profit_factor = rng.uniform(1.1, 2.0, size=n)
     
     final_equity = initial_capital * (1 + total_return)
-    
-    return {
-        "strategy": strategy,
-        "symbol": symbol,
-        "start_date": start_date,
-        "end_date": end_date,
-        "initial_capital": initial_capital,
-        "final_equity": final_equity,
-        "total_return": total_return,
-        "annualized_return": total_return * 2,  # 简化计算
-        "max_drawdown": max_drawdown,
-        "sharpe_ratio": sharpe_ratio,
-        "win_rate": win_rate,
-        "total_trades": total_trades,
-        "winning_trades": int(total_trades * win_rate),
-        "losing_trades": int(total_trades * (1 - win_rate)),
-        "profit_factor": random.uniform(1.1, 2.0)
-    }
+    annualized_return = total_return * 2  # 简化计算
+    winning_trades = (total_trades * win_rate).astype(np.int64)
+    losing_trades = (total_trades * (1 - win_rate)).astype(np.int64)
+    
+    columns = zip(
+        strategies,
+        final_equity.tolist(),
+        total_return.tolist(),
+        annualized_return.tolist(),
+        max_drawdown.tolist(),
+        sharpe_ratio.tolist(),
+        win_rate.tolist(),
+        total_trades.tolist(),
+        winning_trades.tolist(),
+        losing_trades.tolist(),
+        profit_factor.tolist(),
+    )
+    
+    return [
+        {
+            "strategy": strategy,
+            "symbol": symbol,
+            "start_date": start_date,
+            "end_date": end_date,
+            "initial_capital": initial_capital,
+            "final_equity": equity,
+            "total_return": ret,
+            "annualized_return": annual_ret,
+            "max_drawdown": drawdown,
+            "sharpe_ratio": sharpe,
+            "win_rate": win,
+            "total_trades": trades,
+            "winning_trades": winning,
+            "losing_trades": losing,
+            "profit_factor": factor
+        }
+        for (
+            strategy, equity, ret, annual_ret, drawdown, sharpe,
+            win, trades, winning, losing, factor
+        ) in columns
+    ]
 
 
 def display_backtest_result(result: Dict[str, Any]) -> None:
@@ -537,14 +810,14 @@ def display_result_chart(result: Dict[str, Any]) -> None:
     max_drawdown = result.get("max_drawdown", 0)
     
     # 绘制简单的收益柱状图
-    return_bar_length = int(abs(total_return) * 50)
-    drawdown_bar_length = int(max_drawdown * 50)
+    return_bar_length = min(int(abs(total_return) * 50), BAR_MAX)
+    drawdown_bar_length = min(int(max_drawdown * 50), BAR_MAX)
     
     if total_return >= 0:
-        click.echo(f"收益: {'█' * return_bar_length} +{FormatUtils.format_percentage(total_return)}")
+        click.echo(f"收益: {_FULL_BAR[:return_bar_length]} +{FormatUtils.format_percentage(total_return)}")
     else:
-        click.echo(f"收益: {'▓' * return_bar_length} {FormatUtils.format_percentage(total_return)}")
-    click.echo(f"回撤: {'░' * drawdown_bar_length} -{FormatUtils.format_percentage(max_drawdown)}")
+        click.echo(f"收益: {_MED_BAR[:return_bar_length]} {FormatUtils.format_percentage(total_return)}")
+    click.echo(f"回撤: {_LIGHT_BAR[:drawdown_bar_length]} -{FormatUtils.format_percentage(max_drawdown)}")
 
 
 def generate_detailed_report(result: Dict[str, Any]) -> None:
@@ -601,18 +874,19 @@ def display_strategy_comparison(results: List[Dict[str, Any]]) -> None:
     click.echo(header_line)
     click.echo("-" * len(header_line))
     
-    # 数据行
-    for result in results:
-        row_data = [
-            result.get("strategy", "N/A")[:12],
-            FormatUtils.format_percentage(result.get("total_return", 0))[:12],
-            FormatUtils.format_percentage(result.get("max_drawdown", 0))[:12],
-            f"{result.get('sharpe_ratio', 0):.4f}"[:12],
-            FormatUtils.format_percentage(result.get("win_rate", 0))[:12],
-            str(result.get("total_trades", 0))[:12]
-        ]
-        row_line = " | ".join(f"{d:<12}" for d in row_data)
-        click.echo(row_line)
+    # 数据行：按列批量格式化，避免逐行逐列调用格式化函数
+    columns = [
+        [str(r.get("strategy", "N/A")) for r in results],
+        FormatUtils.format_percentage_array([r.get("total_return", 0) for r in results]),
+        FormatUtils.format_percentage_array([r.get("max_drawdown", 0) for r in results]),
+        np.char.mod("%.4f", np.array([r.get("sharpe_ratio", 0) for r in results], dtype=np.float64)),
+        FormatUtils.format_percentage_array([r.get("win_rate", 0) for r in results]),
+        [str(r.get("total_trades", 0)) for r in results],
+    ]
+    click.echo("\n".join(
+        " | ".join(f"{d[:12]:<12}" for d in row_data)
+        for row_data in zip(*(np.asarray(col).tolist() for col in columns))
+    ))
     
     # 找出最佳策略
     click.echo("\n🏆 最佳策略:")
@@ -631,11 +905,12 @@ def save_backtest_result(result: Dict[str, Any], output_path: str) -> None:
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
     with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False, default=str)
+        JsonUtils.dump(result, f)
 
 
 def main():
     """回测工具主入口"""
+    _ensure_runtime()
     try:
         backtest_cli()
     except KeyboardInterrupt:
@@ -6,23 +6,514 @@ AI Stock Trading System - 主命令行工具
 提供系统的主要功能入口和交互式命令行界面。
 """
 
-import asyncio
+import atexit
 import click
 import sys
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Dict, Any, BinaryIO, Callable, Iterable, List, Tuple
 from pathlib import Path
-import json
 
-from ai_stock import __version__, get_version_info, get_architecture_info
+from ai_stock import __version__, _ensure_runtime, get_version_info, get_architecture_info
+from ai_stock.cli._cached_group import CachedGroup
 from ai_stock.utils.config_utils import ConfigUtils
+from ai_stock.utils.json_utils import JsonUtils
 from ai_stock.utils.logging_utils import setup_logger, set_global_log_level
-from ai_stock.data.collectors.binance_collector import BinanceCollector
-from ai_stock.data.collectors.yfinance_collector import YFinanceCollector
-from ai_stock.signals.generators.trading_signal_generator import TradingSignalGenerator
 from ai_stock.core.exceptions import AIStockError
 
+if TYPE_CHECKING:
+    import asyncio
 
-@click.group()
+
+# 输出文件写缓冲区大小（1 MiB，默认 8 KiB）
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# 流式写入 JSON 数组时每批缓冲的记录数
+STREAM_FLUSH_RECORDS = 1024
+
+# 边拉取边写入时，拉取与写入之间最多缓冲的 K 线页数
+STREAM_QUEUE_PAGES = 4
+
+# 进程内共享的事件循环，由 _get_loop() 按需创建（asyncio 只在异步命令中导入，
+# info/config/--help 等同步命令不加载 asyncio）
+_LOOP: Optional["asyncio.AbstractEventLoop"] = None
+
+# 已解析的配置文件，键为 (绝对路径, 修改时间)
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+@lru_cache(maxsize=None)
+def _get_default_config() -> Dict[str, Any]:
+    """进程内缓存的默认配置（默认配置是字典字面量，直接构建比读取磁盘 pickle 更快）"""
+    return ConfigUtils.create_default_config()
+
+
+def _load_config(config_path: str) -> Dict[str, Any]:
+    """
+    加载配置文件，按 (路径, 修改时间) 缓存解析结果
+    
+    Args:
+        config_path: 配置文件路径
+        
+    Returns:
+        配置字典
+    """
+    path = Path(config_path).resolve()
+    key = (str(path), path.stat().st_mtime_ns)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        cached = _CONFIG_CACHE[key] = ConfigUtils.load_config(path)
+    return cached
+
+
+def _write_json_array(f: BinaryIO, records: Iterable[Dict[str, Any]]) -> None:
+    """
+    以 JSON 数组格式流式写入记录（每行一条）
+    
+    每条记录单独编码，累积 STREAM_FLUSH_RECORDS 条后批量写入，内存占用与记录总数无关。
+    
+    Args:
+        f: 二进制文件对象
+        records: 记录迭代器
+    """
+    f.write(b"[\n")
+    buf = []
+    written = False
+    for record in records:
+        buf.append(JsonUtils.dumpb(record))
+        if len(buf) >= STREAM_FLUSH_RECORDS:
+            if written:
+                f.write(b",\n")
+            f.write(b",\n".join(buf))
+            buf.clear()
+            written = True
+    if buf:
+        if written:
+            f.write(b",\n")
+        f.write(b",\n".join(buf))
+    f.write(b"\n]\n")
+
+
+# 列式导出时可选的 K 线字段，所有记录都有值时才输出
+_OPTIONAL_KLINE_COLUMNS = ("quote_volume", "taker_buy_base_volume", "taker_buy_quote_volume")
+
+# 定点量化时的价格缩放系数（保留 4 位小数，与显示精度一致）
+PRICE_SCALE = 10_000
+
+
+def klines_to_soa(klines: List[Any], quantize: Optional[str] = None) -> Dict[str, Any]:
+    """
+    将 K 线列表转换为列式结构（每个字段一个 NumPy 数组）
+    
+    字段名只出现一次，数值列由 JsonUtils 直接按数组序列化。
+    
+    Args:
+        klines: 同一交易对的 K 线列表
+        quantize: 量化方式；"float32" 将数值列降为 float32，
+            "fixed" 将 OHLC 存为 round(价格 * PRICE_SCALE) 的整数并记录 price_scale
+        
+    Returns:
+        {"symbol": ..., "open_time": ndarray, "open": ndarray, ...}
+    """
+    import numpy as np
+    
+    n = len(klines)
+    value_dtype = np.float32 if quantize == "float32" else np.float64
+    soa: Dict[str, Any] = {"symbol": klines[0].symbol if n else None}
+    for name in ("open_time", "close_time"):
+        soa[name] = np.fromiter((getattr(k, name) for k in klines), dtype=np.int64, count=n)
+    for name in ("open", "high", "low", "close"):
+        prices = np.fromiter((getattr(k, name) for k in klines), dtype=np.float64, count=n)
+        if quantize == "fixed":
+            # int64 而非 int32：价格超过 214748 时 int32 会溢出
+            soa[name] = np.rint(prices * PRICE_SCALE).astype(np.int64)
+        else:
+            soa[name] = prices.astype(value_dtype, copy=False)
+    soa["volume"] = np.fromiter((k.volume for k in klines), dtype=value_dtype, count=n)
+    for name in _OPTIONAL_KLINE_COLUMNS:
+        values = [getattr(k, name) for k in klines]
+        if n and all(v is not None for v in values):
+            soa[name] = np.array(values, dtype=value_dtype)
+    soa["ignore"] = np.fromiter((k.ignore for k in klines), dtype=np.bool_, count=n)
+    if quantize == "fixed":
+        soa["price_scale"] = PRICE_SCALE
+    return soa
+
+
+def _parse_symbols(symbol: Tuple[str, ...]) -> List[str]:
+    """解析 --symbol 参数（可重复指定，也可逗号分隔），去重并保持顺序"""
+    symbols = [s.strip() for value in symbol for s in value.split(",") if s.strip()]
+    return list(dict.fromkeys(symbols))
+
+
+def _symbol_output_path(output: str, symbol: str, multiple: bool) -> Path:
+    """多个交易对时按交易对拆分输出文件，如 data.json -> data_BTCUSDT.json"""
+    output_path = Path(output)
+    if not multiple:
+        return output_path
+    return output_path.with_name(f"{output_path.stem}_{symbol}{output_path.suffix}")
+
+
+@lru_cache(maxsize=None)
+def _get_collector_cls(source: str) -> type:
+    """按数据源导入采集器类（按需导入，每个数据源只导入一次）"""
+    if source == "binance":
+        from ai_stock.data.collectors.binance_collector import BinanceCollector
+        return BinanceCollector
+    from ai_stock.data.collectors.yfinance_collector import YFinanceCollector
+    return YFinanceCollector
+
+
+def _create_collector(source: str):
+    """创建数据采集器"""
+    return _get_collector_cls(source.lower())()
+
+
+async def _acquire_collector(ctx: click.Context, source: str):
+    """
+    获取已启动的数据采集器
+    
+    交互式模式下采集器缓存在 ctx.obj["collectors"] 中，整个会话复用同一连接；
+    否则每次新建，由调用方在使用后停止。
+    
+    Returns:
+        (采集器, 是否为会话共享)
+    """
+    collectors = ctx.obj.get("collectors") if ctx.obj else None
+    if collectors is None:
+        collector = _create_collector(source)
+        await collector.start()
+        return collector, False
+    
+    key = source.lower()
+    if key not in collectors:
+        collector = _create_collector(source)
+        await collector.start()
+        collectors[key] = collector
+    return collectors[key], True
+
+
+def _get_loop() -> "asyncio.AbstractEventLoop":
+    """
+    获取进程内共享的事件循环
+    
+    首次调用时创建并在进程退出时关闭，避免每个子命令重复创建和销毁事件循环；
+    交互式模式下共享的采集器连接也绑定在这个循环上。非 Windows 平台安装了 uvloop 时使用 uvloop。
+    """
+    import asyncio
+    
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        if sys.platform == "win32":
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        else:
+            try:
+                import uvloop
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            except ImportError:
+                pass
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+        atexit.register(_LOOP.close)
+    return _LOOP
+
+
+def _run_async(coro) -> Any:
+    """在共享事件循环上运行协程"""
+    return _get_loop().run_until_complete(coro)
+
+
+async def _stream_klines_to_file(
+    collector,
+    symbol: str,
+    interval: str,
+    limit: int,
+    output_path: Path
+) -> int:
+    """
+    边拉取边写入 K 线
+    
+    生产者通过 collector.iter_klines() 逐页拉取并放入有界队列，消费者逐页编码写入文件，
+    网络等待与编码写入相互重叠。
+    
+    Returns:
+        写入的 K 线条数
+    """
+    import asyncio
+    
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_PAGES)
+    
+    async def produce():
+        try:
+            async for page in collector.iter_klines(symbol, interval, limit):
+                await queue.put(page)
+        except asyncio.CancelledError:
+            # 被取消说明消费者已退出，无需结束标记
+            raise
+        except Exception:
+            # 丢弃未消费的页面，保证结束标记不会因队列已满而阻塞；异常由下方 await producer 抛出
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+            raise
+        await queue.put(None)
+    
+    async def consume() -> int:
+        count = 0
+        with open(output_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write(b"[\n")
+            while True:
+                page = await queue.get()
+                if page is None:
+                    break
+                if not page:
+                    continue
+                if count:
+                    f.write(b",\n")
+                f.write(b",\n".join(JsonUtils.dumpb(kline.to_dict()) for kline in page))
+                count += len(page)
+            f.write(b"\n]\n")
+        return count
+    
+    producer = asyncio.ensure_future(produce())
+    try:
+        count = await consume()
+    except BaseException:
+        producer.cancel()
+        # 等待生产者真正结束，其自身的异常不覆盖消费者的异常
+        await asyncio.gather(producer, return_exceptions=True)
+        raise
+    # 生产者的异常（如网络错误）在这里抛出
+    await producer
+    return count
+
+
+async def _do_collect_streaming(
+    collector,
+    symbols: List[str],
+    interval: str,
+    limit: int,
+    output: str
+) -> None:
+    """并发地将多个交易对的 K 线边拉取边写入文件"""
+    import asyncio
+    
+    paths = [_symbol_output_path(output, sym, len(symbols) > 1) for sym in symbols]
+    for path in paths:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    
+    results = await asyncio.gather(
+        *(_stream_klines_to_file(collector, sym, interval, limit, path)
+          for sym, path in zip(symbols, paths)),
+        return_exceptions=True
+    )
+    
+    for sym, path, count in zip(symbols, paths, results):
+        if isinstance(count, Exception):
+            # 不保留写了一半的文件
+            if path.exists():
+                path.unlink()
+            click.echo(f"❌ {sym} 数据采集失败: {count}", err=True)
+        elif not count:
+            path.unlink()
+            click.echo(f"❌ {sym} 未获取到数据", err=True)
+        else:
+            click.echo(f"✅ {sym} 成功获取 {count} 条数据")
+            click.echo(f"📁 数据已保存到: {path}")
+
+
+async def _do_collect(
+    collector,
+    symbols: List[str],
+    interval: str,
+    limit: int,
+    output: Optional[str],
+    columnar: bool = False,
+    quantize: Optional[str] = None
+) -> None:
+    """使用给定采集器并发采集多个交易对的数据并输出"""
+    import asyncio
+    
+    # 按行输出到文件且采集器支持分页拉取时，拉取与写入重叠进行
+    if output and not (columnar or quantize) and hasattr(collector, "iter_klines"):
+        await _do_collect_streaming(collector, symbols, interval, limit, output)
+        return
+    
+    results = await asyncio.gather(
+        *(collector.get_klines(s, interval, limit) for s in symbols),
+        return_exceptions=True
+    )
+    
+    for sym, klines in zip(symbols, results):
+        if isinstance(klines, Exception):
+            click.echo(f"❌ {sym} 数据采集失败: {klines}", err=True)
+            continue
+        if not klines:
+            click.echo(f"❌ {sym} 未获取到数据", err=True)
+            continue
+        
+        click.echo(f"✅ {sym} 成功获取 {len(klines)} 条数据")
+        
+        # 输出数据
+        if output:
+            output_path = _symbol_output_path(output, sym, len(symbols) > 1)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(output_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+                if columnar or quantize:
+                    f.write(JsonUtils.dumpb(klines_to_soa(klines, quantize and quantize.lower())))
+                else:
+                    # 逐条编码、分批写入，不在内存中构建完整的字典列表
+                    _write_json_array(f, (kline.to_dict() for kline in klines))
+            
+            click.echo(f"📁 数据已保存到: {output_path}")
+        else:
+            # 显示最新几条数据
+            lines = [f"\n📊 {sym} 最新数据:"]
+            for i, kline in enumerate(klines[-5:], 1):
+                lines.append(
+                    f"  {i}. 时间: {kline.open_time}, "
+                    f"开: {kline.open:.4f}, "
+                    f"高: {kline.high:.4f}, "
+                    f"低: {kline.low:.4f}, "
+                    f"收: {kline.close:.4f}, "
+                    f"量: {kline.volume:.2f}"
+                )
+            click.echo("\n".join(lines))
+
+
+async def _do_signal(
+    collector,
+    symbols: List[str],
+    interval: str,
+    limit: int,
+    output: Optional[str]
+) -> None:
+    """
+    使用给定采集器并发获取多个交易对的市场数据并生成信号
+    
+    每个交易对的数据到达后立即生成信号，与其余交易对的网络请求重叠进行。
+    信号生成留在事件循环线程中执行：生成器通过 asyncio.create_task 派发信号回调，
+    在工作线程中调用会因没有运行中的事件循环而丢失回调。
+    """
+    import asyncio
+    from ai_stock.signals.generators.trading_signal_generator import TradingSignalGenerator
+    
+    # 创建信号生成器
+    signal_generator = TradingSignalGenerator()
+    
+    async def fetch_and_generate(sym: str):
+        market_data = await collector.get_market_data(sym, interval, limit)
+        if not market_data or not market_data.klines:
+            return market_data, None
+        return market_data, signal_generator.generate_signals(market_data)
+    
+    results = await asyncio.gather(
+        *(fetch_and_generate(s) for s in symbols),
+        return_exceptions=True
+    )
+    
+    for sym, result in zip(symbols, results):
+        if isinstance(result, Exception):
+            click.echo(f"❌ {sym} 信号生成失败: {result}", err=True)
+            continue
+        market_data, signals = result
+        if signals is None:
+            click.echo(f"❌ {sym} 未获取到市场数据", err=True)
+            continue
+        
+        click.echo(f"✅ {sym} 获取到 {len(market_data.klines)} 条市场数据")
+        
+        if not signals:
+            click.echo(f"🔍 {sym} 未生成任何交易信号")
+            continue
+        
+        click.echo(f"🎯 {sym} 生成了 {len(signals)} 个交易信号")
+        
+        # 显示信号（按模板拼接、编码后一次性写入）
+        _write_stdout("".join(_render_signal(i, sig) for i, sig in enumerate(signals, 1)))
+        
+        # 保存信号
+        if output:
+            signals_data = []
+            for sig in signals:
+                signals_data.append({
+                    "id": sig.id,
+                    "symbol": sig.symbol,
+                    "side": sig.side.value,
+                    "price": sig.price,
+                    "confidence": sig.confidence,
+                    "reason": sig.reason,
+                    "strength": sig.strength.value,
+                    "timestamp": sig.timestamp
+                })
+            
+            output_path = _symbol_output_path(output, sym, len(symbols) > 1)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(output_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+                f.write(JsonUtils.dumpb(signals_data, indent=True))
+            
+            click.echo(f"📁 信号已保存到: {output_path}")
+
+
+# 信号显示模板
+SIDE_EMOJI = {"BUY": "🟢", "SELL": "🔴"}
+STRENGTH_EMOJI = {"STRONG": "🔥", "MODERATE": "⚡", "WEAK": "💫"}
+SIGNAL_TEMPLATE = (
+    "  {i}. {side_emoji} {side} {symbol} @ {price:.4f} {strength_emoji}\n"
+    "     置信度: {confidence:.2%}\n"
+    "     原因: {reason}\n"
+    "\n"
+)
+
+
+def _write_stdout(text: str) -> None:
+    """
+    将大段文本一次编码后直接写入标准输出的二进制缓冲区，绕过 click.echo 的逐段处理
+    
+    标准输出没有二进制缓冲区时退回 click.echo；Windows 上同样退回 click.echo，
+    由文本层转换换行符（CRLF），并由 click 处理控制台编码。
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or sys.platform == "win32":
+        click.echo(text, nl=False)
+        return
+    # 先刷新文本层，保证与之前 click.echo 的输出顺序一致
+    stream.flush()
+    buffer.write(text.encode(stream.encoding or "utf-8", errors="replace"))
+    buffer.flush()
+
+
+def _render_signal(i: int, sig) -> str:
+    """按 SIGNAL_TEMPLATE 渲染单个信号"""
+    side = sig.side.value
+    strength = sig.strength.value
+    return SIGNAL_TEMPLATE.format(
+        i=i,
+        side_emoji=SIDE_EMOJI.get(side, "🔴"),
+        side=side,
+        symbol=sig.symbol,
+        price=sig.price,
+        strength_emoji=STRENGTH_EMOJI.get(strength, ""),
+        confidence=sig.confidence,
+        reason=sig.reason
+    )
+
+
+async def _do_test(collector, test_symbol: str) -> None:
+    """使用给定采集器测试数据连接"""
+    click.echo("📡 测试数据连接...")
+    ticker = await collector.get_ticker(test_symbol)
+    
+    click.echo(f"✅ 连接成功!")
+    click.echo(f"测试数据: {test_symbol} 价格 {ticker.price:.4f}")
+    
+    # 测试状态
+    status = collector.get_status()
+    click.echo(f"采集器状态: {status}")
+
+
+@click.group(cls=CachedGroup)
 @click.version_option(version=__version__)
 @click.option(
     "--config", "-c",
@@ -58,13 +549,13 @@ def cli(ctx: click.Context, config: Optional[str], log_level: str, verbose: bool
     # 加载配置
     if config:
         try:
-            ctx.obj["config"] = ConfigUtils.load_config(config)
+            ctx.obj["config"] = _load_config(config)
             click.echo(f"已加载配置文件: {config}")
         except Exception as e:
             click.echo(f"配置文件加载失败: {e}", err=True)
             sys.exit(1)
     else:
-        ctx.obj["config"] = ConfigUtils.create_default_config()
+        ctx.obj["config"] = _get_default_config()
     
     ctx.obj["log_level"] = log_level
     ctx.obj["verbose"] = verbose
@@ -74,28 +565,32 @@ def cli(ctx: click.Context, config: Optional[str], log_level: str, verbose: bool
 @click.pass_context
 def info(ctx: click.Context):
     """显示系统信息"""
-    click.echo(f"🚀 AI Stock Trading System v{__version__}")
-    click.echo("=" * 50)
+    click.echo(_render_info(), nl=False)
+
+
+@lru_cache(maxsize=1)
+def _render_info() -> str:
+    """渲染系统信息文本（内容只与已安装版本有关，渲染一次后缓存）"""
+    lines = [f"🚀 AI Stock Trading System v{__version__}", "=" * 50]
     
     # 版本信息
     version_info = get_version_info()
-    click.echo("📊 版本信息:")
-    for key, value in version_info.items():
-        click.echo(f"  {key}: {value}")
-    
-    click.echo()
+    lines.append("📊 版本信息:")
+    lines.extend(f"  {key}: {value}" for key, value in version_info.items())
+    lines.append("")
     
     # 架构信息
     arch_info = get_architecture_info()
-    click.echo("🏗️ 架构信息:")
-    click.echo(f"  版本: {arch_info['version']}")
-    click.echo(f"  迁移状态: {arch_info['migration']['status']}")
-    click.echo(f"  从 {arch_info['migration']['from']} 迁移到 {arch_info['migration']['to']}")
+    lines.append("🏗️ 架构信息:")
+    lines.append(f"  版本: {arch_info['version']}")
+    lines.append(f"  迁移状态: {arch_info['migration']['status']}")
+    lines.append(f"  从 {arch_info['migration']['from']} 迁移到 {arch_info['migration']['to']}")
+    lines.append("")
     
-    click.echo()
-    click.echo("📦 系统层次:")
-    for layer, description in arch_info["layers"].items():
-        click.echo(f"  {description}")
+    lines.append("📦 系统层次:")
+    lines.extend(f"  {description}" for description in arch_info["layers"].values())
+    lines.append("")
+    return "\n".join(lines)
 
 
 @cli.command()
@@ -108,7 +603,8 @@ def info(ctx: click.Context):
 @click.option(
     "--symbol",
     required=True,
-    help="交易对符号，如 BTCUSDT 或 AAPL"
+    multiple=True,
+    help="交易对符号，如 BTCUSDT 或 AAPL；可重复指定或用逗号分隔多个"
 )
 @click.option(
     "--interval", "-i",
@@ -126,71 +622,48 @@ def info(ctx: click.Context):
     type=click.Path(),
     help="输出文件路径"
 )
+@click.option(
+    "--columnar",
+    is_flag=True,
+    help="按列输出（每个字段一个数组），文件更小、写入更快"
+)
+@click.option(
+    "--quantize",
+    type=click.Choice(["float32", "fixed"], case_sensitive=False),
+    help="按列输出时量化数值：float32 或 4 位小数定点整数（隐含 --columnar）"
+)
 @click.pass_context
 def collect(
     ctx: click.Context,
     source: str,
-    symbol: str,
+    symbol: Tuple[str, ...],
     interval: str,
     limit: int,
-    output: Optional[str]
+    output: Optional[str],
+    columnar: bool = False,
+    quantize: Optional[str] = None
 ):
     """采集市场数据"""
+    symbols = _parse_symbols(symbol)
     click.echo(f"🔍 开始采集数据...")
     click.echo(f"数据源: {source}")
-    click.echo(f"交易对: {symbol}")
+    click.echo(f"交易对: {', '.join(symbols)}")
     click.echo(f"时间间隔: {interval}")
     click.echo(f"数据量: {limit}")
     
     async def collect_data():
         try:
-            # 创建数据采集器
-            if source.lower() == "binance":
-                collector = BinanceCollector()
-            else:
-                collector = YFinanceCollector()
-            
-            await collector.start()
-            
-            # 获取数据
-            klines = await collector.get_klines(symbol, interval, limit)
-            
-            if not klines:
-                click.echo("❌ 未获取到数据", err=True)
-                return
-            
-            click.echo(f"✅ 成功获取 {len(klines)} 条数据")
-            
-            # 输出数据
-            if output:
-                data = [kline.to_dict() for kline in klines]
-                output_path = Path(output)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-                
-                click.echo(f"📁 数据已保存到: {output_path}")
-            else:
-                # 显示最新几条数据
-                click.echo("\n📊 最新数据:")
-                for i, kline in enumerate(klines[-5:], 1):
-                    click.echo(
-                        f"  {i}. 时间: {kline.open_time}, "
-                        f"开: {kline.open:.4f}, "
-                        f"高: {kline.high:.4f}, "
-                        f"低: {kline.low:.4f}, "
-                        f"收: {kline.close:.4f}, "
-                        f"量: {kline.volume:.2f}"
-                    )
-            
-            await collector.stop()
-            
+            collector, shared = await _acquire_collector(ctx, source)
+            try:
+                await _do_collect(collector, symbols, interval, limit, output, columnar, quantize)
+            finally:
+                if not shared:
+                    await collector.stop()
         except Exception as e:
             click.echo(f"❌ 数据采集失败: {e}", err=True)
             sys.exit(1)
     
-    asyncio.run(collect_data())
+    _run_async(collect_data())
 
 
 @cli.command()
@@ -203,7 +676,8 @@ def collect(
 @click.option(
     "--symbol",
     required=True,
-    help="交易对符号"
+    multiple=True,
+    help="交易对符号；可重复指定或用逗号分隔多个"
 )
 @click.option(
     "--interval", "-i",
@@ -225,92 +699,31 @@ def collect(
 def signal(
     ctx: click.Context,
     source: str,
-    symbol: str,
+    symbol: Tuple[str, ...],
     interval: str,
     limit: int,
     output: Optional[str]
 ):
     """生成交易信号"""
+    symbols = _parse_symbols(symbol)
     click.echo(f"🔮 开始生成交易信号...")
     click.echo(f"数据源: {source}")
-    click.echo(f"交易对: {symbol}")
+    click.echo(f"交易对: {', '.join(symbols)}")
     click.echo(f"时间间隔: {interval}")
     
     async def generate_signals():
         try:
-            # 创建数据采集器
-            if source.lower() == "binance":
-                collector = BinanceCollector()
-            else:
-                collector = YFinanceCollector()
-            
-            await collector.start()
-            # 获取市场数据
-            market_data = await collector.get_market_data(symbol, interval, limit)
-            
-            if not market_data or not market_data.klines:
-                click.echo("❌ 未获取到市场数据", err=True)
-                return
-            
-            click.echo(f"✅ 获取到 {len(market_data.klines)} 条市场数据")
-            
-            # 创建信号生成器
-            signal_generator = TradingSignalGenerator()
-            
-            # 生成信号
-            signals = signal_generator.generate_signals(market_data)
-            
-            if not signals:
-                click.echo("🔍 未生成任何交易信号")
-            else:
-                click.echo(f"🎯 生成了 {len(signals)} 个交易信号")
-                
-                # 显示信号
-                for i, sig in enumerate(signals, 1):
-                    side_emoji = "🟢" if sig.side.value == "BUY" else "🔴"
-                    strength_emoji = {
-                        "STRONG": "🔥",
-                        "MODERATE": "⚡",
-                        "WEAK": "💫"
-                    }.get(sig.strength.value, "")
-                    
-                    click.echo(
-                        f"  {i}. {side_emoji} {sig.side.value} {sig.symbol} "
-                        f"@ {sig.price:.4f} {strength_emoji}"
-                    )
-                    click.echo(f"     置信度: {sig.confidence:.2%}")
-                    click.echo(f"     原因: {sig.reason}")
-                    click.echo()
-                
-                # 保存信号
-                if output:
-                    signals_data = []
-                    for sig in signals:
-                        signals_data.append({
-                            "id": sig.id,
-                            "symbol": sig.symbol,
-                            "side": sig.side.value,
-                            "price": sig.price,
-                            "confidence": sig.confidence,
-                            "reason": sig.reason,
-                            "strength": sig.strength.value,
-                            "timestamp": sig.timestamp
-                        })
-                    
-                    output_path = Path(output)
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        json.dump(signals_data, f, indent=2, ensure_ascii=False)
-                    
-                    click.echo(f"📁 信号已保存到: {output_path}")
-            
-            await collector.stop()
-            
+            collector, shared = await _acquire_collector(ctx, source)
+            try:
+                await _do_signal(collector, symbols, interval, limit, output)
+            finally:
+                if not shared:
+                    await collector.stop()
         except Exception as e:
             click.echo(f"❌ 信号生成失败: {e}", err=True)
             sys.exit(1)
-    asyncio.run(generate_signals())
+    
+    _run_async(generate_signals())
 
 
 @cli.command()
@@ -336,19 +749,19 @@ def config(ctx: click.Context, config_file: Optional[str]):
         # 显示当前配置
         current_config = ctx.obj.get("config", {})
         
-        click.echo("⚙️ 当前配置:")
-        click.echo("=" * 30)
+        lines = ["⚙️ 当前配置:", "=" * 30]
         
         def print_config(config_dict, indent=0):
             for key, value in config_dict.items():
                 prefix = "  " * indent
                 if isinstance(value, dict):
-                    click.echo(f"{prefix}{key}:")
+                    lines.append(f"{prefix}{key}:")
                     print_config(value, indent + 1)
                 else:
-                    click.echo(f"{prefix}{key}: {value}")
+                    lines.append(f"{prefix}{key}: {value}")
         
         print_config(current_config)
+        click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -364,35 +777,78 @@ def test(ctx: click.Context, source: str):
     click.echo(f"🔧 测试系统连接...")
     click.echo(f"数据源: {source}")
     
+    test_symbol = "BTCUSDT" if source.lower() == "binance" else "AAPL"
+    
     async def test_connection():
         try:
-            # 创建数据采集器
-            if source.lower() == "binance":
-                collector = BinanceCollector()
-                test_symbol = "BTCUSDT"
-            else:
-                collector = YFinanceCollector()
-                test_symbol = "AAPL"
-            
-            await collector.start()
-            
-            # 测试连接
-            click.echo("📡 测试数据连接...")
-            ticker = await collector.get_ticker(test_symbol)
-            
-            click.echo(f"✅ 连接成功!")
-            click.echo(f"测试数据: {test_symbol} 价格 {ticker.price:.4f}")
-            
-            # 测试状态
-            status = collector.get_status()
-            click.echo(f"采集器状态: {status}")
-            
-            await collector.stop()
+            collector, shared = await _acquire_collector(ctx, source)
+            try:
+                await _do_test(collector, test_symbol)
+            finally:
+                if not shared:
+                    await collector.stop()
         except Exception as e:
             click.echo(f"❌ 连接测试失败: {e}", err=True)
             sys.exit(1)
     
-    asyncio.run(test_connection())
+    _run_async(test_connection())
+
+
+def _command_defaults(command: click.Command) -> Dict[str, Any]:
+    """命令各参数的默认值（经 Click 处理后的值），交互式模式直接调用回调函数时使用"""
+    return command.make_context(command.name, [], resilient_parsing=True).params
+
+
+def _invoke_callback(command: click.Command, **kwargs) -> Any:
+    """跳过 Click 参数解析，直接以默认参数调用命令回调（需在已有上下文中调用）"""
+    return command.callback(**{**_INTERACTIVE_DEFAULTS[command.name], **kwargs})
+
+
+def _interactive_help(args: List[str]) -> None:
+    click.echo("\n".join([
+        "可用命令:",
+        "  info             - 显示系统信息",
+        "  collect SYMBOL.. - 采集数据",
+        "  signal SYMBOL..  - 生成信号",
+        "  test [SOURCE]    - 测试连接",
+        "  config           - 显示配置",
+        "  help             - 显示帮助",
+        "  exit             - 退出",
+    ]))
+
+
+def _interactive_symbols(command: click.Command) -> Callable[[List[str]], None]:
+    def handler(args: List[str]) -> None:
+        if not args:
+            click.echo(f"用法: {command.name} SYMBOL [SYMBOL ...]")
+            return
+        _invoke_callback(command, symbol=tuple(args))
+    return handler
+
+
+def _interactive_test(args: List[str]) -> None:
+    if not args:
+        _invoke_callback(test)
+    elif args[0].lower() in ("binance", "yfinance"):
+        _invoke_callback(test, source=args[0])
+    else:
+        click.echo(f"未知数据源: {args[0]}（可选: binance, yfinance）")
+
+
+# 交互式命令分发表（别名直接加入字典）；值为 None 表示退出
+_INTERACTIVE_DEFAULTS = {command.name: _command_defaults(command) for command in (info, collect, signal, config, test)}
+_INTERACTIVE_DISPATCH: Dict[str, Optional[Callable[[List[str]], None]]] = {
+    "info": lambda args: _invoke_callback(info),
+    "config": lambda args: _invoke_callback(config),
+    "test": _interactive_test,
+    "collect": _interactive_symbols(collect),
+    "signal": _interactive_symbols(signal),
+    "help": _interactive_help,
+    "h": _interactive_help,
+    "exit": None,
+    "quit": None,
+    "q": None,
+}
 
 
 @cli.command()
@@ -402,41 +858,48 @@ def interactive(ctx: click.Context):
     click.echo("🎮 启动交互式模式...")
     click.echo("输入 'help' 查看可用命令，'exit' 退出")
     
-    while True:
-        try:
-            command = click.prompt("ai-stock", type=str).strip()
-            
-            if command.lower() in ['exit', 'quit', 'q']:
-                break
-            elif command.lower() in ['help', 'h']:
-                click.echo("可用命令:")
-                click.echo("  info     - 显示系统信息")
-                click.echo("  collect  - 采集数据")
-                click.echo("  signal   - 生成信号")
-                click.echo("  test     - 测试连接")
-                click.echo("  config   - 显示配置")
-                click.echo("  help     - 显示帮助")
-                click.echo("  exit     - 退出")
-            elif command.lower() == 'info':
-                ctx.invoke(info)
-            elif command.lower() == 'config':
-                ctx.invoke(config)
-            elif command.lower() == 'test':
-                ctx.invoke(test)
-            else:
-                click.echo(f"未知命令: {command}")
-                click.echo("输入 'help' 查看可用命令")
+    # 会话内共享数据采集器，避免每条命令重新建立连接；
+    # 配置在 cli() 中加载一次后保存在 ctx.obj["config"]，子命令不会重新加载
+    ctx.obj["collectors"] = {}
+    
+    try:
+        while True:
+            try:
+                parts = click.prompt("ai-stock", type=str).split()
+                if not parts:
+                    continue
+                command = parts[0].casefold()
                 
-        except (KeyboardInterrupt, EOFError):
-            break
-        except Exception as e:
-            click.echo(f"命令执行失败: {e}", err=True)
+                if command not in _INTERACTIVE_DISPATCH:
+                    click.echo(f"未知命令: {parts[0]}")
+                    click.echo("输入 'help' 查看可用命令")
+                    continue
+                
+                handler = _INTERACTIVE_DISPATCH[command]
+                if handler is None:
+                    break
+                handler(parts[1:])
+                    
+            except (KeyboardInterrupt, EOFError):
+                break
+            except SystemExit:
+                # 子命令失败时不退出交互式会话
+                pass
+            except Exception as e:
+                click.echo(f"命令执行失败: {e}", err=True)
+    finally:
+        for collector in ctx.obj.pop("collectors").values():
+            try:
+                _run_async(collector.stop())
+            except Exception as e:
+                click.echo(f"停止数据采集器失败: {e}", err=True)
     
     click.echo("👋 再见!")
 
 
 def main():
     """主入口函数"""
+    _ensure_runtime()
     try:
         cli()
     except AIStockError as e:
@@ -6,41 +6,106 @@ AI Stock Trading System - 监控命令行工具
 提供实时监控和报警功能的命令行界面。
 """
 
-import asyncio
+import atexit
 import click
 import sys
-from typing import Optional, Dict, Any, List
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, BinaryIO
 from pathlib import Path
-import json
 from datetime import datetime, timedelta
-import signal
 import time
 
-from ai_stock import __version__
-from ai_stock.data.collectors.binance_collector import BinanceCollector
-from ai_stock.data.collectors.yfinance_collector import YFinanceCollector
-from ai_stock.signals.generators.trading_signal_generator import TradingSignalGenerator
-from ai_stock.signals.filters.signal_filter import SignalFilter
-from ai_stock.utils.config_utils import ConfigUtils
-from ai_stock.utils.logging_utils import setup_logger
-from ai_stock.utils.format_utils import FormatUtils
-from ai_stock.core.types import Signal
+from ai_stock import __version__, _ensure_runtime
+from ai_stock.cli._cached_group import LazyGroup
+from ai_stock.utils.json_utils import JsonUtils
+
+# 数据采集器、信号生成器等依赖较重，在用到它们的子命令中按需导入
+if TYPE_CHECKING:
+    import asyncio
+    from ai_stock.core.types import Signal
+
+# 活跃信号的保留时长（秒）
+ACTIVE_SIGNAL_TTL = 3600
+
+# 保留的最近错误信息条数
+MAX_RECENT_ERRORS = 100
+
+# 报警/信号日志文件累积的行数或距上次写入的秒数达到阈值时写入磁盘
+LOG_FLUSH_LINES = 32
+LOG_FLUSH_INTERVAL = 1.0
+
+# 价格表每列左对齐并截断到 12 个字符
+_PRICE_ROW_FMT = " | ".join(["{:<12.12}"] * 6)
+_PRICE_HEADER = _PRICE_ROW_FMT.format("交易对", "价格", "24h变化", "成交量", "24h最高", "24h最低")
+
+# 价格没有变化时跳过重绘，但连续跳过这么多次后仍重绘一次（刷新时间戳，表明仍在运行）
+PRICE_TABLE_MAX_SKIPS = 5
+
+_last_price_frame: Optional[int] = None
+_skipped_price_frames = 0
+
+_SIDE_EMOJI = {"BUY": "🟢", "SELL": "🔴"}
+_STRENGTH_EMOJI = {"STRONG": "🔥", "MODERATE": "⚡", "WEAK": "💫"}
 
 
 class MonitorState:
     """监控状态管理"""
     
+    __slots__ = (
+        "running", "signals_generated", "signals_filtered", "start_time",
+        "last_update", "error_count", "errors", "active_signals",
+    )
+    
     def __init__(self):
         self.running = False
         self.signals_generated = 0
         self.signals_filtered = 0
         self.start_time = None
         self.last_update = None
-        self.errors = []
-        self.active_signals = []
+        # 只保留最近的错误信息，长时间运行时内存不随错误数增长
+        self.error_count = 0
+        self.errors: "deque[str]" = deque(maxlen=MAX_RECENT_ERRORS)
+        # 按时间戳升序排列，过期信号总在左端
+        self.active_signals: "deque[Signal]" = deque()
+    
+    def add_signal(self, signal: "Signal") -> None:
+        """加入活跃信号，保持时间戳有序（信号基本按时间到达，通常直接追加）"""
+        active = self.active_signals
+        if not active or active[-1].timestamp <= signal.timestamp:
+            active.append(signal)
+            return
+        index = len(active)
+        while index and active[index - 1].timestamp > signal.timestamp:
+            index -= 1
+        active.insert(index, signal)
+    
+    def record_error(self, message: str) -> None:
+        """记录一条错误信息"""
+        self.error_count += 1
+        self.errors.append(message)
+    
+    def recent_errors(self, count: int) -> List[str]:
+        """最近的 count 条错误信息（按时间先后）"""
+        return list(islice(self.errors, max(0, len(self.errors) - count), None))
+    
+    def expire_signals(self, now: float) -> None:
+        """移除 ACTIVE_SIGNAL_TTL 之前的信号"""
+        active = self.active_signals
+        cutoff = (now - ACTIVE_SIGNAL_TTL) * 1000
+        while active and active[0].timestamp <= cutoff:
+            active.popleft()
+
+
+# 子命令分别定义在 ai_stock.cli._monitor_<name> 中，只导入实际调用的那个
+_SUBCOMMANDS = {
+    name: f"ai_stock.cli._monitor_{name}"
+    for name in ("watch", "prices", "history", "status")
+}
 
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_subcommands=_SUBCOMMANDS)
 @click.version_option(version=__version__)
 @click.option(
     "--config", "-c",
@@ -59,411 +124,171 @@ def monitor_cli(ctx: click.Context, config: Optional[str], verbose: bool):
     
     提供实时监控和报警功能。
     """
+    from ai_stock.utils.logging_utils import setup_logger
+    
     ctx.ensure_object(dict)
     
     # 设置日志
     log_level = "DEBUG" if verbose else "INFO"
     setup_logger("monitor", log_level=log_level)
     
-    # 加载配置
+    # 加载配置（用户指定的配置文件立即加载；默认配置由 get_monitor_config() 在用到时构建）
     if config:
+        from ai_stock.utils.config_utils import ConfigUtils
         try:
             ctx.obj["config"] = ConfigUtils.load_config(config)
             click.echo(f"已加载配置文件: {config}")
         except Exception as e:
             click.echo(f"配置文件加载失败: {e}", err=True)
             sys.exit(1)
-    else:
-        ctx.obj["config"] = ConfigUtils.create_default_config()
     
     ctx.obj["verbose"] = verbose
     ctx.obj["state"] = MonitorState()
 
 
-@monitor_cli.command()
-@click.option(
-    "--source", "-s",
-    type=click.Choice(["binance", "yfinance"], case_sensitive=False),
-    default="binance",
-    help="数据源选择"
-)
-@click.option(
-    "--symbols",
-    required=True,
-    help="监控的交易对，逗号分隔"
-)
-@click.option(
-    "--interval", "-i",
-    default="1m",
-    help="监控间隔"
-)
-@click.option(
-    "--update-frequency",
-    type=int,
-    default=60,
-    help="更新频率（秒）"
-)
-@click.option(
-    "--alert-file",
-    type=click.Path(),
-    help="报警输出文件"
-)
-@click.option(
-    "--log-signals",
-    is_flag=True,
-    help="记录所有信号到文件"
-)
-@click.pass_context
-def watch(
-    ctx: click.Context,
-    source: str,
-    symbols: str,
-    interval: str,
-    update_frequency: int,
-    alert_file: Optional[str],
-    log_signals: bool
-):
-    """实时监控交易信号"""
-    symbol_list = [s.strip().upper() for s in symbols.split(",")]
-    state = ctx.obj["state"]
-    
-    click.echo("👀 启动实时监控...")
-    click.echo(f"数据源: {source}")
-    click.echo(f"监控交易对: {', '.join(symbol_list)}")
-    click.echo(f"监控间隔: {interval}")
-    click.echo(f"更新频率: {update_frequency}秒")
-    click.echo("按 Ctrl+C 停止监控")
-    click.echo("=" * 60)
-    
-    async def monitor_signals():
-        try:
-            # 创建数据采集器
-            if source.lower() == "binance":
-                collector = BinanceCollector()
-            else:
-                collector = YFinanceCollector()
-            
-            await collector.start()
-            
-            # 创建信号生成器和过滤器
-            signal_generator = TradingSignalGenerator()
-            signal_filter = SignalFilter()
-            
-            state.running = True
-            state.start_time = datetime.now()
-            
-            # 设置信号处理
-            def handle_shutdown(signum, frame):
-                state.running = False
-                click.echo("\n🛑 收到停止信号，正在关闭监控...")
-            
-            signal.signal(signal.SIGINT, handle_shutdown)
-            signal.signal(signal.SIGTERM, handle_shutdown)
-            
-            last_display_time = 0
-            
-            while state.running:
-                try:
-                    current_time = time.time()
-                    
-                    # 获取所有交易对的数据
-                    for symbol in symbol_list:
-                        try:
-                            # 获取市场数据
-                            market_data = await collector.get_market_data(symbol, interval, 100)
-                            
-                            # 生成信号
-                            signals = signal_generator.generate_signals(market_data)
-                            state.signals_generated += len(signals)
-                            
-                            # 过滤信号
-                            filtered_signals = signal_filter.filter_signals(signals)
-                            state.signals_filtered += len(filtered_signals)
-                            
-                            # 处理新信号
-                            for signal in filtered_signals:
-                                await handle_new_signal(signal, alert_file, log_signals)
-                                state.active_signals.append(signal)
-                            
-                            # 清理过期信号
-                            state.active_signals = [
-                                s for s in state.active_signals
-                                if current_time - (s.timestamp / 1000) < 3600  # 1小时内的信号
-                            ]
-                            
-                        except Exception as e:
-                            error_msg = f"处理 {symbol} 时出错: {e}"
-                            state.errors.append(error_msg)
-                            click.echo(f"⚠️ {error_msg}")
-                    
-                    state.last_update = datetime.now()
-                    
-                    # 定期显示状态
-                    if current_time - last_display_time >= update_frequency:
-                        display_monitor_status(state, symbol_list)
-                        last_display_time = current_time
-                    
-                    # 等待下次更新
-                    await asyncio.sleep(5)  # 每5秒检查一次
-                    
-                except Exception as e:
-                    error_msg = f"监控循环出错: {e}"
-                    state.errors.append(error_msg)
-                    click.echo(f"❌ {error_msg}")
-                    await asyncio.sleep(10)  # 出错后等待更长时间
-            
-            await collector.stop()
-            click.echo("✅ 监控已停止")
-            
-        except Exception as e:
-            click.echo(f"❌ 监控启动失败: {e}", err=True)
-            sys.exit(1)
+def create_collector(source: str):
+    """
+    创建数据采集器（只导入所选数据源的采集器）
     
-    asyncio.run(monitor_signals())
+    source 由 click.Choice 校验并规范为 "binance" 或 "yfinance"。
+    """
+    if source == "binance":
+        from ai_stock.data.collectors.binance_collector import BinanceCollector
+        return BinanceCollector()
+    from ai_stock.data.collectors.yfinance_collector import YFinanceCollector
+    return YFinanceCollector()
 
 
-@monitor_cli.command()
-@click.option(
-    "--source", "-s",
-    type=click.Choice(["binance", "yfinance"], case_sensitive=False),
-    default="binance",
-    help="数据源选择"
-)
-@click.option(
-    "--symbols",
-    help="交易对列表，逗号分隔（为空时显示所有）"
-)
-@click.option(
-    "--sort-by",
-    type=click.Choice(["price", "volume", "change"], case_sensitive=False),
-    default="change",
-    help="排序方式"
-)
-@click.option(
-    "--limit", "-n",
-    type=int,
-    default=20,
-    help="显示数量限制"
-)
-@click.option(
-    "--refresh",
-    type=int,
-    default=10,
-    help="刷新间隔（秒）"
-)
-@click.pass_context
-def prices(
-    ctx: click.Context,
-    source: str,
-    symbols: Optional[str],
-    sort_by: str,
-    limit: int,
-    refresh: int
-):
-    """实时价格监控"""
-    click.echo("💹 启动价格监控...")
-    click.echo(f"数据源: {source}")
-    click.echo(f"排序: {sort_by}")
-    click.echo(f"刷新间隔: {refresh}秒")
-    click.echo("按 Ctrl+C 停止")
-    click.echo("=" * 80)
-    
-    async def monitor_prices():
+def run_monitor(coro) -> Any:
+    """运行监控协程；非 Windows 平台安装了 uvloop 时使用 uvloop 事件循环"""
+    import asyncio
+    
+    if sys.platform != "win32":
         try:
-            # 创建数据采集器
-            if source.lower() == "binance":
-                collector = BinanceCollector()
-            else:
-                collector = YFinanceCollector()
-            
-            await collector.start()
-            
-            # 获取交易对列表
-            if symbols:
-                symbol_list = [s.strip().upper() for s in symbols.split(",")]
-            else:
-                # 使用默认的热门交易对
-                if source.lower() == "binance":
-                    symbol_list = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "SOLUSDT"]
-                else:
-                    symbol_list = ["AAPL", "GOOGL", "MSFT", "TSLA", "AMZN"]
-            
-            running = True
-            
-            def handle_shutdown(signum, frame):
-                nonlocal running
-                running = False
-                click.echo("\n🛑 停止价格监控...")
-            
-            signal.signal(signal.SIGINT, handle_shutdown)
-            signal.signal(signal.SIGTERM, handle_shutdown)
-            
-            while running:
-                try:
-                    # 获取所有价格数据
-                    price_data = []
-                    
-                    for symbol in symbol_list[:limit]:
-                        try:
-                            ticker = await collector.get_ticker(symbol)
-                            price_data.append({
-                                "symbol": ticker.symbol,
-                                "price": ticker.price,
-                                "change_24h": ticker.change_percent_24h,
-                                "volume": ticker.volume,
-                                "high": ticker.high_price,
-                                "low": ticker.low_price
-                            })
-                        except Exception as e:
-                            click.echo(f"⚠️ 获取 {symbol} 价格失败: {e}")
-                    
-                    # 排序
-                    if sort_by == "price":
-                        price_data.sort(key=lambda x: x["price"], reverse=True)
-                    elif sort_by == "volume":
-                        price_data.sort(key=lambda x: x["volume"], reverse=True)
-                    else:  # change
-                        price_data.sort(key=lambda x: x["change_24h"], reverse=True)
-                    
-                    # 显示价格表格
-                    display_price_table(price_data)
-                    
-                    # 等待刷新
-                    await asyncio.sleep(refresh)
-                except Exception as e:
-                    click.echo(f"❌ 价格监控错误: {e}")
-                    await asyncio.sleep(5)
-            
-            await collector.stop()
-            
-        except Exception as e:
-            click.echo(f"❌ 价格监控启动失败: {e}", err=True)
-            sys.exit(1)
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+    return asyncio.run(coro)
+
+
+def install_shutdown_handlers(message: str) -> "asyncio.Event":
+    """
+    在当前事件循环上安装 SIGINT/SIGTERM 处理，返回收到信号时被设置的停止事件
     
-    asyncio.run(monitor_prices())
+    使用 loop.add_signal_handler，处理函数随事件循环关闭而移除；
+    不支持的平台（Windows）退回 signal.signal，并通过 call_soon_threadsafe 唤醒事件循环。
+    """
+    import asyncio
+    import signal
+    
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+    
+    def shutdown() -> None:
+        if not stop_event.is_set():
+            click.echo(message)
+            stop_event.set()
+    
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, shutdown)
+        except NotImplementedError:
+            signal.signal(signum, lambda *_: loop.call_soon_threadsafe(shutdown))
+    return stop_event
 
 
-@monitor_cli.command()
-@click.option(
-    "--file", "-f",
-    type=click.Path(exists=True),
-    help="信号日志文件路径"
-)
-@click.option(
-    "--symbol",
-    help="过滤特定交易对"
-)
-@click.option(
-    "--side",
-    type=click.Choice(["BUY", "SELL"], case_sensitive=False),
-    help="过滤交易方向"
-)
-@click.option(
-    "--min-confidence",
-    type=float,
-    help="最小置信度过滤"
-)
-@click.option(
-    "--limit", "-n",
-    type=int,
-    default=50,
-    help="显示数量限制"
-)
-@click.pass_context
-def history(
-    ctx: click.Context,
-    file: Optional[str],
-    symbol: Optional[str],
-    side: Optional[str],
-    min_confidence: Optional[float],
-    limit: int
-):
-    """查看信号历史"""
-    click.echo("📋 信号历史查询")
+async def wait_for_stop(stop_event: "asyncio.Event", timeout: float) -> None:
+    """等待 timeout 秒，收到停止信号时提前返回"""
+    import asyncio
     
     try:
-        if file:
-            # 从文件读取信号历史
-            with open(file, 'r', encoding='utf-8') as f:
-                signal_data = []
-                for line in f:
-                    try:
-                        signal_json = json.loads(line.strip())
-                        signal_data.append(signal_json)
-                    except json.JSONDecodeError:
-                        continue
-        else:
-            # 模拟一些历史信号
-            signal_data = generate_mock_signal_history()
-        
-        # 应用过滤器
-        filtered_signals = signal_data
-        
-        if symbol:
-            filtered_signals = [s for s in filtered_signals if s.get("symbol", "").upper() == symbol.upper()]
-        
-        if side:
-            filtered_signals = [s for s in filtered_signals if s.get("side", "").upper() == side.upper()]
-        
-        if min_confidence is not None:
-            filtered_signals = [s for s in filtered_signals if s.get("confidence", 0) >= min_confidence]
-        
-        # 按时间排序
-        filtered_signals.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
-        
-        # 限制数量
-        filtered_signals = filtered_signals[:limit]
-        
-        # 显示结果
-        display_signal_history(filtered_signals)
-        
-    except Exception as e:
-        click.echo(f"❌ 历史查询失败: {e}", err=True)
-        sys.exit(1)
+        await asyncio.wait_for(stop_event.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
 
 
-@monitor_cli.command()
-@click.pass_context
-def status(ctx: click.Context):
-    """显示监控状态"""
-    state = ctx.obj["state"]
-    
-    click.echo("📊 监控状态")
-    click.echo("=" * 40)
+@lru_cache(maxsize=1)
+def _get_default_config() -> Dict[str, Any]:
+    """进程内缓存的默认配置"""
+    from ai_stock.utils.config_utils import ConfigUtils
+    return ConfigUtils.create_default_config()
+
+
+def get_monitor_config(ctx: click.Context) -> Dict[str, Any]:
+    """当前监控命令的配置：--config 指定的配置文件，否则为默认配置"""
+    config = ctx.obj.get("config")
+    if config is None:
+        config = ctx.obj["config"] = _get_default_config()
+    return config
+
+
+class _JsonLinesWriter:
+    """保持打开的 JSON 行文件，批量追加写入"""
     
-    if state.running:
-        click.echo("🟢 状态: 运行中")
-        uptime = datetime.now() - state.start_time if state.start_time else timedelta(0)
-        click.echo(f"⏱️ 运行时间: {format_duration(uptime)}")
-    else:
-        click.echo("🔴 状态: 已停止")
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = open(path, 'ab')
+        self._pending: List[bytes] = []
+        self._last_flush = time.monotonic()
     
-    click.echo(f"📈 生成信号数: {state.signals_generated}")
-    click.echo(f"✅ 有效信号数: {state.signals_filtered}")
-    click.echo(f"🎯 活跃信号数: {len(state.active_signals)}")
+    def write(self, line: bytes) -> None:
+        """追加一行已编码的 JSON（不含换行符）"""
+        self._pending.append(line)
+        if len(self._pending) >= LOG_FLUSH_LINES or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL:
+            self.flush()
     
-    if state.last_update:
-        click.echo(f"🔄 最后更新: {state.last_update.strftime('%H:%M:%S')}")
+    def flush(self) -> None:
+        if self._pending:
+            self._file.write(b"\n".join(self._pending) + b"\n")
+            self._pending.clear()
+            self._file.flush()
+        self._last_flush = time.monotonic()
     
-    if state.errors:
-        click.echo(f"❌ 错误数量: {len(state.errors)}")
-        if ctx.obj.get("verbose"):
-            click.echo("最近错误:")
-            for error in state.errors[-5:]:
-                click.echo(f"  • {error}")
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+
+_SIGNAL_WRITERS: Dict[Path, _JsonLinesWriter] = {}
+
+
+def _get_signal_writer(path: Path) -> _JsonLinesWriter:
+    writer = _SIGNAL_WRITERS.get(path)
+    if writer is None:
+        writer = _SIGNAL_WRITERS[path] = _JsonLinesWriter(path)
+    return writer
 
 
-async def handle_new_signal(signal: Signal, alert_file: Optional[str], log_signals: bool) -> None:
+def flush_signal_writers() -> None:
+    """把所有报警/信号日志中尚未写入的行写入磁盘"""
+    for writer in _SIGNAL_WRITERS.values():
+        writer.flush()
+
+
+def close_signal_writers() -> None:
+    """写入剩余内容并关闭报警/信号日志文件"""
+    while _SIGNAL_WRITERS:
+        _, writer = _SIGNAL_WRITERS.popitem()
+        writer.close()
+
+
+atexit.register(close_signal_writers)
+
+
+@lru_cache(maxsize=256)
+def _format_clock(second: int) -> str:
+    """按秒缓存的 HH:MM:SS，同一秒内的信号不再重复 strftime"""
+    return datetime.fromtimestamp(second).strftime("%H:%M:%S")
+
+
+async def handle_new_signal(signal: "Signal", alert_file: Optional[str], log_signals: bool) -> None:
     """处理新信号"""
     # 显示信号
-    side_emoji = "🟢" if signal.side.value == "BUY" else "🔴"
-    strength_emoji = {
-        "STRONG": "🔥",
-        "MODERATE": "⚡",
-        "WEAK": "💫"
-    }.get(signal.strength.value, "")
+    side_emoji = _SIDE_EMOJI.get(signal.side.value, "🔴")
+    strength_emoji = _STRENGTH_EMOJI.get(signal.strength.value, "")
     
-    timestamp = datetime.fromtimestamp(signal.timestamp / 1000).strftime("%H:%M:%S")
+    timestamp = _format_clock(int(signal.timestamp // 1000))
     
     click.echo(
         f"[{timestamp}] {side_emoji} {signal.side.value} {signal.symbol} "
@@ -471,97 +296,92 @@ async def handle_new_signal(signal: Signal, alert_file: Optional[str], log_signa
         f"({signal.confidence:.1%})"
     )
     
+    if not (alert_file or log_signals):
+        return
+    
+    # 报警文件和信号日志写入同一条记录，只编码一次
+    line = JsonUtils.dumpb({
+        "id": signal.id,
+        "timestamp": signal.timestamp,
+        "datetime": datetime.fromtimestamp(signal.timestamp / 1000).isoformat(),
+        "symbol": signal.symbol,
+        "side": signal.side.value,
+        "price": signal.price,
+        "confidence": signal.confidence,
+        "strength": signal.strength.value,
+        "reason": signal.reason
+    })
+    
     # 报警文件
     if alert_file:
-        alert_data = {
-            "timestamp": signal.timestamp,
-            "datetime": datetime.fromtimestamp(signal.timestamp / 1000).isoformat(),
-            "symbol": signal.symbol,
-            "side": signal.side.value,
-            "price": signal.price,
-            "confidence": signal.confidence,
-            "strength": signal.strength.value,
-            "reason": signal.reason
-        }
-        
-        alert_path = Path(alert_file)
-        alert_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(alert_path, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(alert_data, ensure_ascii=False) + "\n")
+        _get_signal_writer(Path(alert_file)).write(line)
     
     # 信号日志
     if log_signals:
-        log_path = Path("signals.log")
-        signal_data = {
-            "id": signal.id,
-            "timestamp": signal.timestamp,
-            "symbol": signal.symbol,
-            "side": signal.side.value,
-            "price": signal.price,
-            "confidence": signal.confidence,
-            "strength": signal.strength.value,
-            "reason": signal.reason
-        }
-        
-        with open(log_path, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(signal_data, ensure_ascii=False) + "\n")
+        _get_signal_writer(Path("signals.log")).write(line)
 
 
-def display_monitor_status(state: MonitorState, symbols: List[str]) -> None:
-    """显示监控状态"""
-    current_time = datetime.now().strftime("%H:%M:%S")
-    uptime = datetime.now() - state.start_time if state.start_time else timedelta(0)
-    click.echo(f"\n📊 [{current_time}] 监控状态 (运行时间: {format_duration(uptime)})")
-    click.echo(f"监控交易对: {', '.join(symbols)}")
-    click.echo(f"生成信号: {state.signals_generated} | 有效信号: {state.signals_filtered} | 活跃信号: {len(state.active_signals)}")
+def display_monitor_status(state: MonitorState, symbols: List[str], now: Optional[datetime] = None) -> None:
+    """显示监控状态（now 为调用方本轮已取得的当前时间）"""
+    if now is None:
+        now = datetime.now()
+    current_time = now.strftime("%H:%M:%S")
+    uptime = now - state.start_time if state.start_time else timedelta(0)
+    lines = [
+        f"\n📊 [{current_time}] 监控状态 (运行时间: {format_duration(uptime)})",
+        f"监控交易对: {', '.join(symbols)}",
+        f"生成信号: {state.signals_generated} | 有效信号: {state.signals_filtered} | 活跃信号: {len(state.active_signals)}",
+    ]
     
     if state.active_signals:
-        click.echo("最近信号:")
-        for signal in state.active_signals[-3:]:
-            side_emoji = "🟢" if signal.side.value == "BUY" else "🔴"
-            signal_time = datetime.fromtimestamp(signal.timestamp / 1000).strftime("%H:%M")
-            click.echo(f"  [{signal_time}] {side_emoji} {signal.side.value} {signal.symbol} @ {signal.price:.4f}")
+        lines.append("最近信号:")
+        for signal in reversed(list(islice(reversed(state.active_signals), 3))):
+            side_emoji = _SIDE_EMOJI.get(signal.side.value, "🔴")
+            signal_time = _format_clock(int(signal.timestamp // 1000))[:5]
+            lines.append(f"  [{signal_time}] {side_emoji} {signal.side.value} {signal.symbol} @ {signal.price:.4f}")
     
-    click.echo("-" * 60)
+    lines.append("-" * 60)
+    click.echo("\n".join(lines))
 
 
 def display_price_table(price_data: List[Dict[str, Any]]) -> None:
-    """显示价格表格"""
+    """显示价格表格（数据与上一帧相同时不重绘）"""
+    global _last_price_frame, _skipped_price_frames
+    
+    frame = hash(tuple(
+        (d["symbol"], d["price"], d["change_24h"], d["volume"], d["high"], d["low"])
+        for d in price_data
+    ))
+    if frame == _last_price_frame and _skipped_price_frames < PRICE_TABLE_MAX_SKIPS:
+        _skipped_price_frames += 1
+        return
+    _last_price_frame = frame
+    _skipped_price_frames = 0
+    
+    from ai_stock.utils.format_utils import FormatUtils
+    
     # 清屏（在支持的终端中）
     click.clear()
     
     current_time = datetime.now().strftime("%H:%M:%S")
-    click.echo(f"💹 实时价格 [{current_time}]")
-    click.echo("=" * 80)
     
-    # 表头
-    headers = ["交易对", "价格", "24h变化", "成交量", "24h最高", "24h最低"]
-    header_line = " | ".join(f"{h:<12}" for h in headers)
-    click.echo(header_line)
-    click.echo("-" * len(header_line))
+    lines = [f"💹 实时价格 [{current_time}]", "=" * 80, _PRICE_HEADER, "-" * len(_PRICE_HEADER)]
     
     # 数据行
     for data in price_data:
         change_24h = data["change_24h"]
-        change_color = "green" if change_24h >= 0 else "red"
-        change_prefix = "+" if change_24h >= 0 else ""
-        
-        row_data = [
-            data["symbol"][:12],
-            f"{data['price']:.4f}"[:12],
-            f"{change_prefix}{change_24h:.2f}%"[:12],
-            FormatUtils.format_volume(data["volume"])[:12],
-            f"{data['high']:.4f}"[:12],
-            f"{data['low']:.4f}"[:12]
-        ]
-        
-        row_line = " | ".join(f"{d:<12}" for d in row_data)
-        
-        if change_24h >= 0:
-            click.echo(click.style(row_line, fg="green"))
-        else:
-            click.echo(click.style(row_line, fg="red"))
+        row_line = _PRICE_ROW_FMT.format(
+            data["symbol"],
+            f"{data['price']:.4f}",
+            f"{change_24h:+.2f}%",
+            FormatUtils.format_volume(data["volume"]),
+            f"{data['high']:.4f}",
+            f"{data['low']:.4f}"
+        )
+        lines.append(click.style(row_line, fg="green" if change_24h >= 0 else "red"))
+    
+    # 整帧一次写出
+    click.echo("\n".join(lines))
 
 
 def display_signal_history(signals: List[Dict[str, Any]]) -> None:
@@ -569,58 +389,62 @@ def display_signal_history(signals: List[Dict[str, Any]]) -> None:
     if not signals:
         click.echo("📭 没有找到符合条件的信号")
         return
-    click.echo(f"📋 找到 {len(signals)} 个信号")
-    click.echo("=" * 80)
+    lines = [f"📋 找到 {len(signals)} 个信号", "=" * 80]
     
     for i, signal in enumerate(signals, 1):
         timestamp = signal.get("timestamp", 0)
         dt = datetime.fromtimestamp(timestamp / 1000) if timestamp > 1000000000000 else datetime.fromtimestamp(timestamp)
         
         side = signal.get("side", "").upper()
-        side_emoji = "🟢" if side == "BUY" else "🔴"
+        side_emoji = _SIDE_EMOJI.get(side, "🔴")
         
         strength = signal.get("strength", "").upper()
-        strength_emoji = {
-            "STRONG": "🔥",
-            "MODERATE": "⚡",
-            "WEAK": "💫"
-        }.get(strength, "")
+        strength_emoji = _STRENGTH_EMOJI.get(strength, "")
         
-        click.echo(
+        lines.append(
             f"{i:3d}. [{dt.strftime('%m-%d %H:%M')}] {side_emoji} {side} "
             f"{signal.get('symbol', 'N/A')} @ {signal.get('price', 0):.4f} {strength_emoji}"
         )
-        click.echo(f"     置信度: {signal.get('confidence', 0):.1%} | {signal.get('reason', '')}")
-        click.echo()
+        lines.append(f"     置信度: {signal.get('confidence', 0):.1%} | {signal.get('reason', '')}")
+        lines.append("")
+    
+    click.echo("\n".join(lines))
 
 
-def generate_mock_signal_history() -> List[Dict[str, Any]]:
-    """生成模拟信号历史"""
-    import random
+def generate_mock_signal_history(count: int = 20) -> List[Dict[str, Any]]:
+    """生成模拟信号历史（各字段由 NumPy 批量生成）"""
+    import numpy as np
     
     symbols = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "SOLUSDT"]
     sides = ["BUY", "SELL"]
     strengths = ["STRONG", "MODERATE", "WEAK"]
     
-    signals = []
+    rng = np.random.default_rng()
     current_time = int(time.time() * 1000)
     
-    for i in range(20):
-        timestamp = current_time - (i * 3600000)  # 每小时一个信号
-        
-        signal = {
+    timestamps = current_time - np.arange(count, dtype=np.int64) * 3600000  # 每小时一个信号
+    symbol_idx = rng.integers(0, len(symbols), count)
+    side_idx = rng.integers(0, len(sides), count)
+    strength_idx = rng.integers(0, len(strengths), count)
+    prices = rng.uniform(100, 50000, count)
+    confidences = rng.uniform(0.5, 0.95, count)
+    
+    return [
+        {
             "id": f"signal_{i}",
             "timestamp": timestamp,
-            "symbol": random.choice(symbols),
-            "side": random.choice(sides),
-            "price": random.uniform(100, 50000),
-            "confidence": random.uniform(0.5, 0.95),
-            "strength": random.choice(strengths),
+            "symbol": symbols[sym],
+            "side": sides[sd],
+            "price": price,
+            "confidence": confidence,
+            "strength": strengths[st],
             "reason": f"Technical analysis signal #{i}"
         }
-        signals.append(signal)
-    
-    return signals
+        for i, (timestamp, sym, sd, st, price, confidence) in enumerate(zip(
+            timestamps.tolist(), symbol_idx.tolist(), side_idx.tolist(),
+            strength_idx.tolist(), prices.tolist(), confidences.tolist()
+        ))
+    ]
 
 
 def format_duration(duration: timedelta) -> str:
@@ -639,6 +463,7 @@ def format_duration(duration: timedelta) -> str:
 
 def main():
     """监控工具主入口"""
+    _ensure_runtime()
     try:
         monitor_cli()
     except KeyboardInterrupt:
@@ -6,11 +6,31 @@ AI Stock Trading System - 异常处理模块
 定义系统中使用的所有自定义异常类。
 """
 
-from typing import Any, Dict, Optional
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """类及其父类声明的全部 __slots__"""
+    return tuple(
+        name
+        for klass in reversed(cls.__mro__)
+        for name in klass.__dict__.get("__slots__", ())
+    )
 
 
 class AIStockError(Exception):
-    """AI股票交易系统基础异常类"""
+    """
+    AI股票交易系统基础异常类
+    
+    子类的附加信息以 (key, value) 元组暂存，details 字典在首次访问时才构建；
+    值为空的项不会出现在 details 中。层级为单继承，子类直接调用父类的 __init__，
+    AIStockError 的直接子类可直接赋值 _details_kv，更深层的子类则追加。
+    """
+    
+    __slots__ = ("message", "error_code", "_details", "_details_kv")
     
     def __init__(
         self, 
@@ -18,15 +38,47 @@ class AIStockError(Exception):
         error_code: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        super().__init__(message)
+        Exception.__init__(self, message)
         self.message = message
         self.error_code = error_code
-        self.details = details or {}
+        self._details = details
+        self._details_kv: Tuple[Tuple[str, Any], ...] = ()
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """异常附加信息"""
+        details = self._details
+        if self._details_kv:
+            if details is None:
+                # 没有调用方传入的 details 时一次性构建，不必先建空字典再逐项插入
+                details = {key: value for key, value in self._details_kv if value}
+                self._details = details
+            else:
+                details.update((key, value) for key, value in self._details_kv if value)
+            self._details_kv = ()
+        elif details is None:
+            details = self._details = {}
+        return details
+    
+    @details.setter
+    def details(self, value: Dict[str, Any]) -> None:
+        self._details = value
+        self._details_kv = ()
     
     def __str__(self) -> str:
-        if self.error_code:
-            return f"[{self.error_code}] {self.message}"
-        return self.message
+        error_code = self.error_code
+        if not error_code:
+            return self.message
+        prefix = _ERROR_PREFIXES.get(error_code)
+        if prefix is None:
+            prefix = f"[{error_code}] "
+        return prefix + self.message
+    
+    def __reduce__(self):
+        # BaseException 默认只序列化 __dict__，这里把 __slots__ 中的属性一并带上
+        cls = type(self)
+        state = {name: getattr(self, name) for name in _slot_names(cls) if hasattr(self, name)}
+        return cls, self.args, state
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
@@ -41,6 +93,8 @@ class AIStockError(Exception):
 class DataCollectionError(AIStockError):
     """数据采集相关异常"""
     
+    __slots__ = ("source", "symbol")
+    
     def __init__(
         self,
         message: str,
@@ -48,78 +102,79 @@ class DataCollectionError(AIStockError):
         symbol: Optional[str] = None,
         **kwargs
     ):
-        super().__init__(message, **kwargs)
+        AIStockError.__init__(self, message, **kwargs)
         self.source = source
         self.symbol = symbol
-        if source:
-            self.details["source"] = source
-        if symbol:
-            self.details["symbol"] = symbol
+        self._details_kv = (("source", source), ("symbol", symbol))
 
 
 class DataSourceError(DataCollectionError):
     """数据源连接异常"""
-    pass
+    __slots__ = ()
 
 
 class DataParsingError(DataCollectionError):
     """数据解析异常"""
-    pass
+    __slots__ = ()
 
 
 class DataValidationError(DataCollectionError):
     """数据验证异常"""
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(DataCollectionError):
     """API调用频率限制异常"""
     
+    __slots__ = ("retry_after",)
+    
     def __init__(
         self,
         message: str,
         retry_after: Optional[int] = None,
         **kwargs
     ):
-        super().__init__(message, **kwargs)
+        DataCollectionError.__init__(self, message, **kwargs)
         self.retry_after = retry_after
-        if retry_after:
-            self.details["retry_after"] = retry_after
+        self._details_kv += (("retry_after", retry_after),)
 
 
 class StrategyError(AIStockError):
     """策略相关异常"""
     
+    __slots__ = ("strategy_name",)
+    
     def __init__(
         self,
         message: str,
         strategy_name: Optional[str] = None,
         **kwargs
     ):
-        super().__init__(message, **kwargs)
+        AIStockError.__init__(self, message, **kwargs)
         self.strategy_name = strategy_name
-        if strategy_name:
-            self.details["strategy_name"] = strategy_name
+        self._details_kv = (("strategy_name", strategy_name),)
 
 
 class StrategyInitializationError(StrategyError):
     """策略初始化异常"""
-    pass
+    __slots__ = ()
 
 
 class StrategyExecutionError(StrategyError):
     """策略执行异常"""
-    pass
+    __slots__ = ()
 
 
 class StrategyParameterError(StrategyError):
     """策略参数异常"""
-    pass
+    __slots__ = ()
 
 
 class SignalGenerationError(AIStockError):
     """信号生成相关异常"""
     
+    __slots__ = ("signal_type", "symbol")
+    
     def __init__(
         self,
         message: str,
@@ -127,128 +182,131 @@ class SignalGenerationError(AIStockError):
         symbol: Optional[str] = None,
         **kwargs
     ):
-        super().__init__(message, **kwargs)
+        AIStockError.__init__(self, message, **kwargs)
         self.signal_type = signal_type
         self.symbol = symbol
-        if signal_type:
-            self.details["signal_type"] = signal_type
-        if symbol:
-            self.details["symbol"] = symbol
+        self._details_kv = (("signal_type", signal_type), ("symbol", symbol))
 
 
 class SignalValidationError(SignalGenerationError):
     """信号验证异常"""
-    pass
+    __slots__ = ()
 
 
 class SignalFilterError(SignalGenerationError):
     """信号过滤异常"""
-    pass
+    __slots__ = ()
 
 
 class BacktestError(AIStockError):
     """回测相关异常"""
     
+    __slots__ = ("backtest_id",)
+    
     def __init__(
         self,
         message: str,
         backtest_id: Optional[str] = None,
         **kwargs
     ):
-        super().__init__(message, **kwargs)
+        AIStockError.__init__(self, message, **kwargs)
         self.backtest_id = backtest_id
-        if backtest_id:
-            self.details["backtest_id"] = backtest_id
+        self._details_kv = (("backtest_id", backtest_id),)
 
 
 class BacktestConfigError(BacktestError):
     """回测配置异常"""
-    pass
+    __slots__ = ()
 
 
 class BacktestDataError(BacktestError):
     """回测数据异常"""
-    pass
+    __slots__ = ()
 
 
 class BacktestExecutionError(BacktestError):
     """回测执行异常"""
-    pass
+    __slots__ = ()
 
 
 class NotificationError(AIStockError):
     """通知相关异常"""
     
+    __slots__ = ("channel",)
+    
     def __init__(
         self,
         message: str,
         channel: Optional[str] = None,
         **kwargs
     ):
-        super().__init__(message, **kwargs)
+        AIStockError.__init__(self, message, **kwargs)
         self.channel = channel
-        if channel:
-            self.details["channel"] = channel
+        self._details_kv = (("channel", channel),)
 
 
 class NotificationChannelError(NotificationError):
     """通知渠道异常"""
-    pass
+    __slots__ = ()
 
 
 class NotificationDeliveryError(NotificationError):
     """通知发送异常"""
-    pass
+    __slots__ = ()
 
 
 class RiskManagementError(AIStockError):
     """风险管理相关异常"""
     
+    __slots__ = ("risk_type",)
+    
     def __init__(
         self,
         message: str,
         risk_type: Optional[str] = None,
         **kwargs
     ):
-        super().__init__(message, **kwargs)
+        AIStockError.__init__(self, message, **kwargs)
         self.risk_type = risk_type
-        if risk_type:
-            self.details["risk_type"] = risk_type
+        self._details_kv = (("risk_type", risk_type),)
 
 
 class PositionSizeError(RiskManagementError):
     """仓位大小异常"""
-    pass
+    __slots__ = ()
 
 
 class DrawdownError(RiskManagementError):
     """回撤异常"""
-    pass
+    __slots__ = ()
 
 
 class StopLossError(RiskManagementError):
     """止损异常"""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(AIStockError):
     """配置相关异常"""
     
+    __slots__ = ("config_key",)
+    
     def __init__(
         self,
         message: str,
         config_key: Optional[str] = None,
         **kwargs
     ):
-        super().__init__(message, **kwargs)
+        AIStockError.__init__(self, message, **kwargs)
         self.config_key = config_key
-        if config_key:
-            self.details["config_key"] = config_key
+        self._details_kv = (("config_key", config_key),)
 
 
 class DatabaseError(AIStockError):
     """数据库相关异常"""
     
+    __slots__ = ("operation", "table")
+    
     def __init__(
         self,
         message: str,
@@ -256,18 +314,17 @@ class DatabaseError(AIStockError):
         table: Optional[str] = None,
         **kwargs
     ):
-        super().__init__(message, **kwargs)
+        AIStockError.__init__(self, message, **kwargs)
         self.operation = operation
         self.table = table
-        if operation:
-            self.details["operation"] = operation
-        if table:
-            self.details["table"] = table
+        self._details_kv = (("operation", operation), ("table", table))
 
 
 class NetworkError(AIStockError):
     """网络相关异常"""
     
+    __slots__ = ("url", "status_code")
+    
     def __init__(
         self,
         message: str,
@@ -275,28 +332,27 @@ class NetworkError(AIStockError):
         status_code: Optional[int] = None,
         **kwargs
     ):
-        super().__init__(message, **kwargs)
+        AIStockError.__init__(self, message, **kwargs)
         self.url = url
         self.status_code = status_code
-        if url:
-            self.details["url"] = url
-        if status_code:
-            self.details["status_code"] = status_code
+        self._details_kv = (("url", url), ("status_code", status_code))
 
 
 class AuthenticationError(AIStockError):
     """认证相关异常"""
-    pass
+    __slots__ = ()
 
 
 class AuthorizationError(AIStockError):
     """授权相关异常"""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(AIStockError):
     """数据验证异常"""
     
+    __slots__ = ("field", "value")
+    
     def __init__(
         self,
         message: str,
@@ -304,17 +360,35 @@ class ValidationError(AIStockError):
         value: Optional[Any] = None,
         **kwargs
     ):
-        super().__init__(message, **kwargs)
+        AIStockError.__init__(self, message, **kwargs)
         self.field = field
         self.value = value
-        if field:
-            self.details["field"] = field
-        if value is not None:
-            self.details["value"] = str(value)
+        self._details_kv = (("field", field), ("value", value))
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """
+        异常附加信息（value 可能是很大的对象，只在读取 details 时才转为字符串）
+        
+        value 按是否为 None 判断，空字符串、0 等假值同样保留。
+        """
+        details_kv = self._details_kv
+        if not details_kv:
+            return AIStockError.details.fget(self)
+        self._details_kv = tuple(item for item in details_kv if item[0] != "value")
+        details = AIStockError.details.fget(self)
+        for key, item in details_kv:
+            if key == "value" and item is not None:
+                details["value"] = str(item)
+        return details
+    
+    @details.setter
+    def details(self, value: Dict[str, Any]) -> None:
+        AIStockError.details.fset(self, value)
 
 
-# 异常映射字典，用于错误码到异常类的映射
-EXCEPTION_MAP = {
+# 错误码到异常类的映射
+_EXCEPTION_CLASSES: Dict[str, type] = {
     "DATA_COLLECTION_ERROR": DataCollectionError,
     "DATA_SOURCE_ERROR": DataSourceError,
     "DATA_PARSING_ERROR": DataParsingError,
@@ -347,15 +421,43 @@ EXCEPTION_MAP = {
 }
 
 
+# 对外提供只读视图，防止运行时被修改
+EXCEPTION_MAP: Mapping[str, type] = MappingProxyType(_EXCEPTION_CLASSES)
+
+# 已知错误码的 "[CODE] " 前缀，__str__ 不必每次格式化
+_ERROR_PREFIXES: Dict[str, str] = {code: f"[{code}] " for code in _EXCEPTION_CLASSES}
+
+
 def get_exception_class(error_code: str) -> type:
     """根据错误码获取异常类"""
-    return EXCEPTION_MAP.get(error_code, AIStockError)
+    return _EXCEPTION_CLASSES.get(error_code, AIStockError)
+
+
+# 已知错误码预先绑定 error_code 的构造函数，频繁抛出同一错误码时可直接取用
+_EXCEPTION_FACTORIES: Dict[str, Callable[..., AIStockError]] = {
+    code: partial(cls, error_code=code) for code, cls in _EXCEPTION_CLASSES.items()
+}
+
+
+def get_exception_factory(error_code: str) -> Callable[..., AIStockError]:
+    """
+    根据错误码获取已绑定 error_code 的异常构造函数
+    
+    热点调用方可在模块级取一次，之后 `raise factory(message, **kwargs)`；
+    未知错误码返回绑定该错误码的 AIStockError。
+    """
+    factory = _EXCEPTION_FACTORIES.get(error_code)
+    if factory is None:
+        factory = partial(AIStockError, error_code=error_code)
+    return factory
 
 
 def create_exception(error_code: str, message: str, **kwargs) -> AIStockError:
     """根据错误码创建异常实例"""
-    exception_class = get_exception_class(error_code)
-    return exception_class(message, error_code=error_code, **kwargs)
+    factory = _EXCEPTION_FACTORIES.get(error_code)
+    if factory is None:
+        return AIStockError(message, error_code=error_code, **kwargs)
+    return factory(message, **kwargs)
 
 
 # 导出所有异常类
@@ -408,6 +510,7 @@ __all__ = [
     
     # 工具函数
     "get_exception_class",
+    "get_exception_factory",
     "create_exception",
     "EXCEPTION_MAP",
 ]
\ No newline at end of file
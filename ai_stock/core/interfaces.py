@@ -7,15 +7,35 @@ AI Stock Trading System - 接口定义模块
 """
 
 from abc import ABC, abstractmethod
+from math import fabs as _fabs
 from typing import Any, Dict, List, Optional, Protocol, AsyncContextManager
+
 from ai_stock.core.types import (
     Kline, MarketData, Signal, Trade, EquityPoint, BacktestResult,
-    BacktestConfig, StrategyConfig, TickerData, DepthData
+    BacktestConfig, StrategyConfig, TickerData, DepthData, BUY
+)
+
+# 信号通知模板（同一信号发往多个渠道时只需格式化一次，见 send_signal_notification）
+_SIGNAL_TEMPLATE = (
+    "🚨 交易信号通知\n"
+    "交易对: {}\n"
+    "方向: {}\n"
+    "价格: {:.4f}\n"
+    "置信度: {:.2%}\n"
+    "强度: {}\n"
+    "原因: {}"
 )
 
 
 class IDataCollector(Protocol):
-    """数据采集器接口"""
+    """
+    数据采集器接口
+    
+    连接复用约定：HTTP 会话/连接池在 start() 中创建一次，在采集器整个生命周期内
+    供所有请求复用，stop() 时关闭。监控、交互式命令等长时间运行的调用方只创建一个
+    采集器并在循环中反复调用 get_klines()/get_ticker()，不应在单次请求中新建会话，
+    否则每次请求都要重新建立 TCP/TLS 连接。
+    """
     
     async def get_klines(
         self, 
@@ -35,11 +55,11 @@ class IDataCollector(Protocol):
         ...
     
     async def start(self) -> None:
-        """启动数据采集器"""
+        """启动数据采集器（创建供后续请求复用的会话/连接池）"""
         ...
     
     async def stop(self) -> None:
-        """停止数据采集器"""
+        """停止数据采集器（关闭会话/连接池）"""
         ...
 
 
@@ -102,8 +122,8 @@ class INotificationChannel(Protocol):
         """发送消息"""
         ...
     
-    async def send_signal_notification(self, signal: Signal) -> bool:
-        """发送信号通知"""
+    async def send_signal_notification(self, signal: Signal, message: Optional[str] = None) -> bool:
+        """发送信号通知（message 为已格式化的消息，省略时按信号格式化）"""
         ...
     
     def is_enabled(self) -> bool:
@@ -134,7 +154,12 @@ class IRiskManager(Protocol):
 # 抽象基类实现
 
 class BaseDataCollector(ABC):
-    """数据采集器抽象基类"""
+    """
+    数据采集器抽象基类
+    
+    子类在 start() 中创建会话/连接池并在 stop() 中关闭，请求之间复用同一会话
+    （见 IDataCollector 的连接复用约定）。
+    """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
@@ -181,12 +206,11 @@ class BaseStrategy(ABC):
         self.name = name
         self.config: Optional[StrategyConfig] = None
         self._is_running = False
-        self._performance_stats = {
-            "total_signals": 0,
-            "successful_signals": 0,
-            "accuracy": 0.0,
-            "last_update": 0,
-        }
+        # 性能统计以独立属性保存，get_status() 时才组装为字典
+        self._total_signals = 0
+        self._successful_signals = 0
+        self._accuracy = 0.0
+        self._last_update = 0
     
     @abstractmethod
     async def initialize(self, config: StrategyConfig) -> None:
@@ -199,11 +223,16 @@ class BaseStrategy(ABC):
         pass
     
     def get_status(self) -> Dict[str, Any]:
-        """获取策略状态"""
+        """获取策略状态（性能统计直接由计数属性组装，无需复制内部字典）"""
         return {
             "name": self.name,
             "is_running": self._is_running,
-            "performance": self._performance_stats.copy(),
+            "performance": {
+                "total_signals": self._total_signals,
+                "successful_signals": self._successful_signals,
+                "accuracy": self._accuracy,
+                "last_update": self._last_update,
+            },
         }
     
     async def stop(self) -> None:
@@ -212,13 +241,10 @@ class BaseStrategy(ABC):
     
     def _update_performance(self, success: bool = True) -> None:
         """更新性能统计"""
-        self._performance_stats["total_signals"] += 1
+        self._total_signals += 1
         if success:
-            self._performance_stats["successful_signals"] += 1
-        
-        total = self._performance_stats["total_signals"]
-        successful = self._performance_stats["successful_signals"]
-        self._performance_stats["accuracy"] = successful / total if total > 0 else 0.0
+            self._successful_signals += 1
+        self._accuracy = self._successful_signals / self._total_signals
 
 
 class BaseSignalGenerator(ABC):
@@ -227,12 +253,11 @@ class BaseSignalGenerator(ABC):
     def __init__(self, name: str = "BaseSignalGenerator"):
         self.name = name
         self._is_enabled = True
-        self._stats = {
-            "active_signals": 0,
-            "total_signals_generated": 0,
-            "success_rate": 0.0,
-            "avg_confidence": 0.0,
-        }
+        # 统计以独立属性保存，get_status() 时才组装为字典
+        self._active_signals = 0
+        self._total_signals_generated = 0
+        self._success_rate = 0.0
+        self._avg_confidence = 0.0
     
     @abstractmethod
     def generate_signals(self, market_data: MarketData) -> List[Signal]:
@@ -240,15 +265,25 @@ class BaseSignalGenerator(ABC):
         pass
     
     def filter_signals(self, signals: List[Signal]) -> List[Signal]:
-        """过滤信号（默认实现）"""
+        """
+        过滤信号（默认实现：置信度 > 0.5）
+        
+        开销在于逐个读取 Signal.confidence，比较本身可忽略；先取成数组再用 NumPy/numba
+        比较在任何批量下都比直接的列表推导慢，因此这里不做向量化。
+        """
         return [s for s in signals if s.confidence > 0.5]
     
     def get_status(self) -> Dict[str, Any]:
-        """获取生成器状态"""
+        """获取生成器状态（统计直接由计数属性组装，无需复制内部字典）"""
         return {
             "name": self.name,
             "is_enabled": self._is_enabled,
-            "stats": self._stats.copy(),
+            "stats": {
+                "active_signals": self._active_signals,
+                "total_signals_generated": self._total_signals_generated,
+                "success_rate": self._success_rate,
+                "avg_confidence": self._avg_confidence,
+            },
         }
     
     def enable(self) -> None:
@@ -303,21 +338,22 @@ class BaseNotificationChannel(ABC):
         """发送消息"""
         pass
     
-    async def send_signal_notification(self, signal: Signal) -> bool:
-        """发送信号通知"""
-        message = self._format_signal_message(signal)
+    async def send_signal_notification(self, signal: Signal, message: Optional[str] = None) -> bool:
+        """
+        发送信号通知
+        
+        同一信号发往多个渠道时，调用方可先调用一次 _format_signal_message() 并把结果
+        作为 message 传给每个渠道，避免重复格式化。
+        """
+        if message is None:
+            message = self._format_signal_message(signal)
         return await self.send_message(message)
     
     def _format_signal_message(self, signal: Signal) -> str:
         """格式化信号消息"""
-        return (
-            f"🚨 交易信号通知\n"
-            f"交易对: {signal.symbol}\n"
-            f"方向: {signal.side.value}\n"
-            f"价格: {signal.price:.4f}\n"
-            f"置信度: {signal.confidence:.2%}\n"
-            f"强度: {signal.strength.value}\n"
-            f"原因: {signal.reason}"
+        return _SIGNAL_TEMPLATE.format(
+            signal.symbol, signal.side.value, signal.price,
+            signal.confidence, signal.strength.value, signal.reason
         )
     
     def is_enabled(self) -> bool:
@@ -334,7 +370,11 @@ class BaseNotificationChannel(ABC):
 
 
 class BaseRiskManager(ABC):
-    """风险管理器抽象基类"""
+    """
+    风险管理器抽象基类
+    
+    止损/止盈乘数和仓位上限金额在参数赋值时预先计算，检查方法中只做一次乘法和比较。
+    """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
@@ -343,32 +383,61 @@ class BaseRiskManager(ABC):
         self.stop_loss_pct = self.config.get("stop_loss_pct", 0.02)
         self.take_profit_pct = self.config.get("take_profit_pct", 0.04)
     
+    @property
+    def max_position_size(self) -> float:
+        """单笔仓位占权益的最大比例"""
+        return self._max_position_size
+    
+    @max_position_size.setter
+    def max_position_size(self, value: float) -> None:
+        self._max_position_size = value
+        # 仓位上限金额 = max_position_size * 权益，在下次检查时按当时权益重新计算
+        self._position_limit_equity: Optional[float] = None
+        self._max_position_value = 0.0
+    
+    @property
+    def stop_loss_pct(self) -> float:
+        """止损比例"""
+        return self._stop_loss_pct
+    
+    @stop_loss_pct.setter
+    def stop_loss_pct(self, value: float) -> None:
+        self._stop_loss_pct = value
+        self._buy_sl_mul = 1 - value
+        self._sell_sl_mul = 1 + value
+    
+    @property
+    def take_profit_pct(self) -> float:
+        """止盈比例"""
+        return self._take_profit_pct
+    
+    @take_profit_pct.setter
+    def take_profit_pct(self, value: float) -> None:
+        self._take_profit_pct = value
+        self._buy_tp_mul = 1 + value
+        self._sell_tp_mul = 1 - value
+    
     def check_position_size(self, signal: Signal, current_equity: float) -> bool:
-        """检查仓位大小"""
+        """检查仓位大小（仓位金额 / 权益 <= max_position_size，权益应为正数）"""
         if signal.volume is None:
             return True
         
-        position_value = signal.price * signal.volume
-        position_ratio = position_value / current_equity
-        return position_ratio <= self.max_position_size
+        if current_equity != self._position_limit_equity:
+            self._position_limit_equity = current_equity
+            self._max_position_value = self._max_position_size * current_equity
+        return signal.price * signal.volume <= self._max_position_value
     
     def check_max_drawdown(self, current_drawdown: float) -> bool:
         """检查最大回撤"""
-        return abs(current_drawdown) <= self.max_drawdown
+        return _fabs(current_drawdown) <= self.max_drawdown
     
     def calculate_stop_loss(self, signal: Signal) -> Optional[float]:
         """计算止损价位"""
-        if signal.side == "BUY":
-            return signal.price * (1 - self.stop_loss_pct)
-        else:
-            return signal.price * (1 + self.stop_loss_pct)
+        return signal.price * (self._buy_sl_mul if signal.side == BUY else self._sell_sl_mul)
     
     def calculate_take_profit(self, signal: Signal) -> Optional[float]:
         """计算止盈价位"""
-        if signal.side == "BUY":
-            return signal.price * (1 + self.take_profit_pct)
-        else:
-            return signal.price * (1 - self.take_profit_pct)
+        return signal.price * (self._buy_tp_mul if signal.side == BUY else self._sell_tp_mul)
 
 
 # 上下文管理器接口
@@ -6,12 +6,19 @@ AI Stock Trading System - 核心类型定义
 定义系统中使用的所有数据类型和枚举。
 """
 
-from datetime import datetime
+import sys
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from operator import attrgetter
+from time import time_ns
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
-from pydantic import BaseModel, Field, validator
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Python 3.10+ 的数据类使用 __slots__，实例不再携带 __dict__（回测中K线等对象数量巨大）
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class OrderSide(str, Enum):
@@ -20,6 +27,11 @@ class OrderSide(str, Enum):
     SELL = "SELL"
 
 
+# 模块级别名，热路径中省去 OrderSide 的属性查找；须用 == 比较，side 也可能是普通字符串 "BUY"
+BUY = OrderSide.BUY
+SELL = OrderSide.SELL
+
+
 class SignalStrength(str, Enum):
     """信号强度枚举"""
     STRONG = "STRONG"
@@ -27,6 +39,11 @@ class SignalStrength(str, Enum):
     WEAK = "WEAK"
 
 
+STRONG = SignalStrength.STRONG
+MODERATE = SignalStrength.MODERATE
+WEAK = SignalStrength.WEAK
+
+
 class StrategyStatus(str, Enum):
     """策略状态枚举"""
     RUNNING = "RUNNING"
@@ -43,7 +60,7 @@ class MarketStatus(str, Enum):
     AFTER_MARKET = "AFTER_MARKET"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Kline:
     """K线数据结构"""
     open_time: int  # 开盘时间戳(毫秒)
@@ -60,8 +77,8 @@ class Kline:
     ignore: bool = False  # 忽略标志
 
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典格式"""
-        return {
+        """转换为字典格式（值为 None 的可选字段不输出）"""
+        data = {
             "open_time": self.open_time,
             "open": self.open,
             "high": self.high,
@@ -70,26 +87,126 @@ class Kline:
             "volume": self.volume,
             "close_time": self.close_time,
             "symbol": self.symbol,
-            "quote_volume": self.quote_volume,
-            "taker_buy_base_volume": self.taker_buy_base_volume,
-            "taker_buy_quote_volume": self.taker_buy_quote_volume,
-            "ignore": self.ignore,
         }
+        if self.quote_volume is not None:
+            data["quote_volume"] = self.quote_volume
+        if self.taker_buy_base_volume is not None:
+            data["taker_buy_base_volume"] = self.taker_buy_base_volume
+        if self.taker_buy_quote_volume is not None:
+            data["taker_buy_quote_volume"] = self.taker_buy_quote_volume
+        data["ignore"] = self.ignore
+        return data
+    
+    def to_tuple(self) -> Tuple[int, float, float, float, float, float, int]:
+        """数值字段元组 (open_time, open, high, low, close, volume, close_time)，便于批量写入数组"""
+        return (self.open_time, self.open, self.high, self.low, self.close, self.volume, self.close_time)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MarketData:
-    """市场数据结构"""
+    """
+    市场数据结构
+    
+    除逐根的 klines 外，opens/highs/lows/closes/volumes/open_times 提供按列排列的
+    NumPy 数组，首次访问时从 klines 构建并缓存；之后修改 klines 需调用 invalidate_columns()。
+    """
     klines: List[Kline]
     symbol: str
     timestamp: Optional[int] = None
+    _columns: Dict[str, "np.ndarray"] = field(default_factory=dict, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = int(datetime.now().timestamp() * 1000)
+            self.timestamp = time_ns() // 1_000_000
+    
+    def _column(self, name: str, dtype: str) -> "np.ndarray":
+        column = self._columns.get(name)
+        if column is None:
+            # NumPy 只在首次构建列数组时导入，只用到 Kline 等结构的模块不承担其导入开销
+            import numpy as np
+            klines = self.klines
+            column = np.fromiter(map(attrgetter(name), klines), dtype=dtype, count=len(klines))
+            self._columns[name] = column
+        return column
+    
+    @classmethod
+    def from_arrays(
+        cls,
+        symbol: str,
+        open_times: Any,
+        opens: Any,
+        highs: Any,
+        lows: Any,
+        closes: Any,
+        volumes: Any,
+        close_times: Any,
+        timestamp: Optional[int] = None,
+    ) -> "MarketData":
+        """
+        从按列排列的数组构建市场数据
+        
+        传入的列（转换为 int64/float64 连续数组）直接作为列缓存，之后访问 closes 等
+        属性不必再从 klines 逐个提取。
+        """
+        import numpy as np
+        columns = {
+            "open_time": np.ascontiguousarray(open_times, dtype="int64"),
+            "open": np.ascontiguousarray(opens, dtype="float64"),
+            "high": np.ascontiguousarray(highs, dtype="float64"),
+            "low": np.ascontiguousarray(lows, dtype="float64"),
+            "close": np.ascontiguousarray(closes, dtype="float64"),
+            "volume": np.ascontiguousarray(volumes, dtype="float64"),
+        }
+        close_times = np.ascontiguousarray(close_times, dtype="int64")
+        if any(len(column) != len(close_times) for column in columns.values()):
+            raise ValueError("各列长度不一致")
+        
+        klines = [
+            Kline(open_time, open_, high, low, close, volume, close_time, symbol)
+            for open_time, open_, high, low, close, volume, close_time in zip(
+                *(column.tolist() for column in columns.values()), close_times.tolist()
+            )
+        ]
+        market_data = cls(klines, symbol, timestamp)
+        market_data._columns.update(columns)
+        return market_data
+    
+    def invalidate_columns(self) -> None:
+        """清除按列缓存的数组（klines 被修改后调用）"""
+        self._columns.clear()
+    
+    @property
+    def open_times(self) -> "np.ndarray":
+        """开盘时间戳列（int64，毫秒）"""
+        return self._column("open_time", "int64")
+    
+    @property
+    def opens(self) -> "np.ndarray":
+        """开盘价列（float64）"""
+        return self._column("open", "float64")
+    
+    @property
+    def highs(self) -> "np.ndarray":
+        """最高价列（float64）"""
+        return self._column("high", "float64")
+    
+    @property
+    def lows(self) -> "np.ndarray":
+        """最低价列（float64）"""
+        return self._column("low", "float64")
+    
+    @property
+    def closes(self) -> "np.ndarray":
+        """收盘价列（float64）"""
+        return self._column("close", "float64")
+    
+    @property
+    def volumes(self) -> "np.ndarray":
+        """成交量列（float64）"""
+        return self._column("volume", "float64")
 
 
-@dataclass  
+@dataclass(**_DATACLASS_OPTIONS)
 class Signal:
     """交易信号结构"""
     id: str
@@ -106,10 +223,10 @@ class Signal:
     
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = int(datetime.now().timestamp() * 1000)
+            self.timestamp = time_ns() // 1_000_000
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Trade:
     """交易记录结构"""
     id: str
@@ -130,12 +247,12 @@ class Trade:
     
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = int(datetime.now().timestamp() * 1000)
+            self.timestamp = time_ns() // 1_000_000
         if self.pnl_percent is None and self.entry_price != 0:
             self.pnl_percent = self.pnl / self.entry_price
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class EquityPoint:
     """权益曲线点"""
     time: int
@@ -144,19 +261,18 @@ class EquityPoint:
     drawdown: Optional[float] = None
 
 
-class StrategyConfig(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class StrategyConfig:
     """策略配置"""
     name: str
     description: Optional[str] = None
-    parameters: Dict[str, Any] = Field(default_factory=dict)
+    parameters: Dict[str, Any] = field(default_factory=dict)
     risk_management: Optional[Dict[str, Any]] = None
     trading_config: Optional[Dict[str, Any]] = None
-    
-    class Config:
-        arbitrary_types_allowed = True
 
 
-class BacktestConfig(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class BacktestConfig:
     """回测配置"""
     start_date: str
     end_date: str  
@@ -164,12 +280,9 @@ class BacktestConfig(BaseModel):
     commission: float
     symbols: List[str]
     strategy_config: Optional[StrategyConfig] = None
-    
-    class Config:
-        arbitrary_types_allowed = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BacktestSummary:
     """回测摘要"""
     strategy: str
@@ -180,7 +293,7 @@ class BacktestSummary:
     final_equity: float
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BacktestReturns:
     """回测收益指标"""
     total_return: float
@@ -189,7 +302,7 @@ class BacktestReturns:
     beta: float = 0.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BacktestRisk:
     """回测风险指标"""
     volatility: float
@@ -198,7 +311,7 @@ class BacktestRisk:
     var95: float = 0.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BacktestRiskAdjusted:
     """回测风险调整指标"""
     sharpe_ratio: float
@@ -206,7 +319,7 @@ class BacktestRiskAdjusted:
     calmar_ratio: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BacktestTrading:
     """回测交易指标"""
     total_trades: int
@@ -219,7 +332,7 @@ class BacktestTrading:
     average_trade: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BacktestResult:
     """回测结果"""
     summary: BacktestSummary
@@ -234,7 +347,7 @@ class BacktestResult:
     details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TickerData:
     """行情数据"""
     symbol: str
@@ -258,7 +371,7 @@ class TickerData:
     count: int
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DepthData:
     """市场深度数据"""
     symbol: str
@@ -268,24 +381,26 @@ class DepthData:
     
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = int(datetime.now().timestamp() * 1000)
+            self.timestamp = time_ns() // 1_000_000
 
 
-class NotificationConfig(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class NotificationConfig:
     """通知配置"""
     enabled: bool = True
-    channels: List[str] = Field(default_factory=list)
+    channels: List[str] = field(default_factory=list)
     webhook_url: Optional[str] = None
     email_config: Optional[Dict[str, str]] = None
     wechat_config: Optional[Dict[str, str]] = None
 
 
-class SystemConfig(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class SystemConfig:
     """系统配置"""
     debug: bool = False
     log_level: str = "INFO"
     data_source: str = "binance"
-    notification: NotificationConfig = Field(default_factory=NotificationConfig)
+    notification: NotificationConfig = field(default_factory=NotificationConfig)
     database_url: Optional[str] = None
     redis_url: Optional[str] = None
 
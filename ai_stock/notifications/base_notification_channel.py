@@ -7,6 +7,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, Optional
+import asyncio
 import time
 
 # 通道状态
@@ -17,7 +18,7 @@ class ChannelStatus(Enum):
     MAINTENANCE = 'MAINTENANCE'
 
 # 发送结果
-dataclass
+@dataclass
 class SendResult:
     success: bool
     message_id: Optional[str] = None
@@ -26,7 +27,7 @@ class SendResult:
     delivery_status: Optional[str] = None  # 'PENDING' | 'SENT' | 'DELIVERED' | 'FAILED'
 
 # 通道统计信息
-dataclass
+@dataclass
 class ChannelStatistics:
     total_sent: int = 0
     success_count: int = 0
@@ -76,6 +77,9 @@ class BaseNotificationChannel(ABC):
                     raise Exception('发送失败，返回false')
             except Exception as e:
                 last_error = str(e)
+                # 通道不可用时后续重试必然失败，直接结束；最后一次失败后也不再等待
+                if not self.is_available():
+                    break
                 if attempt < self.max_retries:
                     await self.sleep(self.retry_delay * attempt / 1000)
         response_time = time.time() - start_time
@@ -84,7 +88,6 @@ class BaseNotificationChannel(ABC):
         return SendResult(success=False, message_id=getattr(message, 'id', None), error=last_error, delivery_status='FAILED')
 
     async def sleep(self, seconds: float):
-        import asyncio
         await asyncio.sleep(seconds)
 
     def enable(self):
@@ -103,15 +106,15 @@ class BaseNotificationChannel(ABC):
         return self.is_enabled and self.status == ChannelStatus.ACTIVE
 
     def update_statistics(self, success: bool, response_time: float):
-        self.statistics.total_sent += 1
+        statistics = self.statistics
+        statistics.total_sent += 1
         if success:
-            self.statistics.success_count += 1
+            statistics.success_count += 1
         else:
-            self.statistics.failure_count += 1
-        # 平均响应时间
-        n = self.statistics.total_sent
-        self.statistics.average_response_time = ((self.statistics.average_response_time * (n - 1)) + response_time) / n
-        self.statistics.last_sent_time = time.time()
+            statistics.failure_count += 1
+        # 平均响应时间（增量更新，不必先乘回总和）
+        statistics.average_response_time += (response_time - statistics.average_response_time) / statistics.total_sent
+        statistics.last_sent_time = time.time()
 
     def reset_statistics(self):
         self.statistics = ChannelStatistics()
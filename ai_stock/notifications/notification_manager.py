@@ -4,9 +4,14 @@
 统一管理多个通知通道，支持消息通知开关控制
 """
 from dataclasses import dataclass, field
+from itertools import count
 from typing import Any, Dict, List, Optional
+import asyncio
 from .base_notification_channel import BaseNotificationChannel
 
+MAX_QUEUE_SIZE = 10_000  # 队列上限，满时生产者等待（背压）
+QUEUE_BATCH_SIZE = 64  # 每批最多并发发送的消息数
+
 @dataclass
 class NotificationConfig:
     enabled: bool
@@ -39,8 +44,11 @@ class NotificationManager:
     def __init__(self, config: NotificationConfig):
         self.config = config
         self.channels: Dict[str, BaseNotificationChannel] = {}
-        self.message_queue: List[QueueItem] = []
-        self.processing_queue: set = set()
+        # 队列元素为 (-priority, timestamp, 序号, QueueItem)：优先级高者先出，同优先级按入队顺序
+        # 在事件循环中首次使用时创建（Python 3.9 及以下的队列在构造时绑定事件循环）
+        self.message_queue: Optional[asyncio.PriorityQueue] = None
+        self._queue_seq = count()
+        self._queue_task: Optional["asyncio.Task[None]"] = None
         self.is_processing: bool = False
         self.last_notification_time: float = 0
         self.daily_notification_count: int = 0
@@ -80,10 +88,86 @@ class NotificationManager:
     def get_statistics(self) -> NotificationStatistics:
         return self.statistics
 
+    def init_statistics(self) -> NotificationStatistics:
+        return NotificationStatistics()
+
     def initialize_channels(self):
         # 省略具体实现，保留接口
         pass
 
+    async def enqueue(self, item: QueueItem):
+        """消息入队（队列满时等待），必要时启动队列处理任务"""
+        await self._get_queue().put((-item.priority, item.timestamp, next(self._queue_seq), item))
+        self.statistics.queue_status['pending'] += 1
+        self.start_queue_processor()
+
     def start_queue_processor(self):
-        # 省略具体实现，保留接口
-        pass 
\ No newline at end of file
+        """启动队列处理任务；尚无运行中的事件循环时推迟到首次入队"""
+        if self._queue_task is not None and not self._queue_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._get_queue()
+        self._queue_task = loop.create_task(self._process_queue())
+
+    def _get_queue(self) -> asyncio.PriorityQueue:
+        """返回消息队列，首次调用时创建（须在运行中的事件循环内调用）"""
+        if self.message_queue is None:
+            self.message_queue = asyncio.PriorityQueue(maxsize=MAX_QUEUE_SIZE)
+        return self.message_queue
+
+    def stop_queue_processor(self):
+        if self._queue_task is not None:
+            self._queue_task.cancel()
+            self._queue_task = None
+
+    async def _process_queue(self):
+        """等待队列中的消息，每次取出一批（最多 QUEUE_BATCH_SIZE 条）并发发送"""
+        queue = self._get_queue()
+        while True:
+            items = [(await queue.get())[-1]]
+            while len(items) < QUEUE_BATCH_SIZE and not queue.empty():
+                items.append(queue.get_nowait()[-1])
+            queue_status = self.statistics.queue_status
+            queue_status['pending'] -= len(items)
+            queue_status['processing'] += len(items)
+            self.is_processing = True
+            try:
+                await asyncio.gather(*(self._send_item(item) for item in items))
+            finally:
+                self.is_processing = False
+                queue_status['processing'] -= len(items)
+                for _ in items:
+                    queue.task_done()
+
+    async def _send_item(self, item: QueueItem):
+        """把一条消息发往其所有可用通道"""
+        sends = []
+        for channel_type in item.channels:
+            channel = self.channels.get(channel_type)
+            if channel is not None and channel.is_available():
+                sends.append((channel_type, channel.send_with_retry(item.message, item.signal)))
+        if not sends:
+            return
+        item.attempts += 1
+        results = await asyncio.gather(*(send for _, send in sends), return_exceptions=True)
+        statistics = self.statistics
+        delivered = False
+        for (channel_type, _), result in zip(sends, results):
+            success = not isinstance(result, BaseException) and result.success
+            channel_stats = statistics.channel_stats.setdefault(channel_type, {'sent': 0, 'success': 0, 'failure': 0})
+            channel_stats['sent'] += 1
+            if success:
+                channel_stats['success'] += 1
+                statistics.success_count += 1
+                delivered = True
+            else:
+                channel_stats['failure'] += 1
+                statistics.failure_count += 1
+        if delivered:
+            statistics.total_sent += 1
+            statistics.today_sent += 1
+        else:
+            statistics.queue_status['failed'] += 1 
\ No newline at end of file
@@ -4,7 +4,7 @@
 实现微信公众号模板消息推送功能
 """
 from dataclasses import dataclass, field
-from typing import Any, List, Optional, Dict
+from typing import Any, Optional, Dict, Sequence, Tuple
 from .base_notification_channel import BaseNotificationChannel
 
 @dataclass
@@ -12,7 +12,7 @@ class WeChatConfig:
     app_id: str
     app_secret: str
     template_id: str
-    user_open_ids: List[str]
+    user_open_ids: Sequence[str]  # 校验后转为元组
     url: Optional[str] = None
     mini_program: Optional[Dict[str, Any]] = None
     api_base_url: str = ''
@@ -22,7 +22,8 @@ class WeChatNotificationChannel(BaseNotificationChannel):
     def __init__(self, config: WeChatConfig):
         super().__init__()
         self.config = config
-        self.token_cache: Optional[Dict[str, Any]] = None
+        # (access_token, 计划刷新时间, 实际过期时间)，用元组代替字典，读取时免去键查找
+        self.token_cache: Optional[Tuple[str, float, float]] = None
         self.validate_config()
 
     async def send_notification(self, message: Any, signal: Any) -> bool:
@@ -33,9 +34,18 @@ class WeChatNotificationChannel(BaseNotificationChannel):
         return 'WECHAT'
 
     def validate_config(self):
-        required = ['app_id', 'app_secret', 'template_id', 'user_open_ids', 'api_base_url']
-        for field_name in required:
-            if not getattr(self.config, field_name, None):
-                raise ValueError(f'微信配置缺少必要字段: {field_name}')
-        if not isinstance(self.config.user_open_ids, list) or not self.config.user_open_ids:
-            raise ValueError('微信配置必须包含至少一个用户OpenID') 
\ No newline at end of file
+        config = self.config
+        if not config.app_id:
+            raise ValueError('微信配置缺少必要字段: app_id')
+        if not config.app_secret:
+            raise ValueError('微信配置缺少必要字段: app_secret')
+        if not config.template_id:
+            raise ValueError('微信配置缺少必要字段: template_id')
+        if not config.user_open_ids:
+            raise ValueError('微信配置缺少必要字段: user_open_ids')
+        if not config.api_base_url:
+            raise ValueError('微信配置缺少必要字段: api_base_url')
+        if not isinstance(config.user_open_ids, (list, tuple)):
+            raise ValueError('微信配置必须包含至少一个用户OpenID')
+        # 冻结为元组，发送时遍历且不会被意外修改
+        config.user_open_ids = tuple(config.user_open_ids) 
\ No newline at end of file
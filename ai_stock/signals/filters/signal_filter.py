@@ -6,17 +6,24 @@ AI Stock Trading System - 信号过滤器
 实现交易信号的过滤、验证和质量评估功能。
 """
 
-from typing import List, Dict, Any, Optional, Set, Callable
-from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Set, Callable, Deque, Iterable, Tuple
+from datetime import date, datetime, timedelta
+import logging
+import sys
 import time
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import defaultdict, deque
+
+import numpy as np
 
 from ai_stock.core.types import Signal, OrderSide, SignalStrength, MarketData
 from ai_stock.core.exceptions import SignalFilterError
 from ai_stock.utils.logging_utils import get_logger
 from ai_stock.utils.validation_utils import ValidationUtils
-from ai_stock.utils.math_utils import MathUtils
+
+SIGNAL_HISTORY_SIZE = 1000  # 保留的已接受信号数
+DUPLICATE_WINDOW = 600  # 重复信号判定的时间窗口(秒)
+DUPLICATE_INDEX_SIZE = 16  # 每个 (交易对, 方向) 保留的最近信号数
 
 
 @dataclass
@@ -55,14 +62,18 @@ class SignalFilter:
         self.risk_filters = {
             "max_position_size": self.config.get("max_position_size", 0.1),  # 最大仓位10%
             "max_daily_signals": self.config.get("max_daily_signals", 20),
-            "blacklist_symbols": set(self.config.get("blacklist_symbols", [])),
+            "blacklist_symbols": frozenset(),
         }
+        self._set_blacklist(self.config.get("blacklist_symbols", []))
         
         # 状态管理
-        self._signal_history: List[Signal] = []
+        self._signal_history: Deque[Signal] = deque(maxlen=SIGNAL_HISTORY_SIZE)
+        # 重复信号索引：(交易对, 方向) -> 最近信号的 (时间戳毫秒, 价格, 置信度, ID)，按时间先后排列
+        self._dup_index: Dict[Tuple[str, OrderSide], Deque[Tuple[int, float, float, str]]] = {}
         self._symbol_last_signal: Dict[str, float] = {}
         self._daily_signal_count = 0
         self._last_reset_date = datetime.now().date()
+        self._next_reset_time = self._next_midnight(self._last_reset_date)
         
         # 过滤规则
         self._filter_rules = self._initialize_filter_rules()
@@ -131,8 +142,8 @@ class SignalFilter:
         final_signals = self._post_process_signals(filtered_signals)
         
         self.logger.debug(
-            f"信号过滤完成: 输入{len(signals)}, 输出{len(final_signals)}, "
-            f"过滤率{(len(signals) - len(final_signals)) / len(signals) * 100:.1f}%"
+            "信号过滤完成: 输入%d, 输出%d, 过滤率%.1f%%",
+            len(signals), len(final_signals), (len(signals) - len(final_signals)) / len(signals) * 100
         )
         
         return final_signals
@@ -198,29 +209,34 @@ class SignalFilter:
             ),
         ]
         # 按优先级排序
-        return sorted([r for r in rules if r.enabled], key=lambda x: x.priority)
+        active_rules = sorted([r for r in rules if r.enabled], key=lambda x: x.priority)
+        # 逐信号执行时直接遍历绑定方法元组，不必每次读取 FilterRule 的属性
+        self._active_funcs = tuple(r.filter_func for r in active_rules)
+        return active_rules
     
     def _validate_signal_basic(self, signal: Signal) -> bool:
         """基础信号验证"""
         try:
             errors = ValidationUtils.validate_signal(signal)
             if errors:
-                self._log_filter_reason(signal, "validation_failed", f"验证失败: {'; '.join(errors)}")
+                self._log_filter_reason(signal, "validation_failed", "验证失败: %s", "; ".join(errors))
                 return False
             return True
         except Exception as e:
-            self._log_filter_reason(signal, "validation_error", f"验证异常: {e}")
+            self._log_filter_reason(signal, "validation_error", "验证异常: %s", e)
             return False
     
     def _apply_filter_rules(self, signal: Signal, context: Dict[str, Any]) -> bool:
         """应用所有过滤规则"""
-        for rule in self._filter_rules:
-            try:
-                if not rule.filter_func(signal, context):
+        funcs = self._active_funcs
+        try:
+            for func in funcs:
+                if not func(signal, context):
                     return False
-            except Exception as e:
-                self.logger.error(f"过滤规则 {rule.name} 执行失败: {e}")
-                return False
+        except Exception as e:
+            rule = self._filter_rules[funcs.index(func)]
+            self.logger.error(f"过滤规则 {rule.name} 执行失败: {e}")
+            return False
         
         return True
     
@@ -229,7 +245,7 @@ class SignalFilter:
         if signal.confidence < self.min_confidence:
             self._log_filter_reason(
                 signal, "low_confidence", 
-                f"置信度({signal.confidence:.3f}) < 最小要求({self.min_confidence})"
+                "置信度(%.3f) < 最小要求(%s)", signal.confidence, self.min_confidence
             )
             return False
         return True
@@ -242,7 +258,7 @@ class SignalFilter:
         if current_time - last_signal_time < self.signal_cooldown:
             self._log_filter_reason(
                 signal, "cooldown", 
-                f"冷却时间未到: {current_time - last_signal_time:.1f}s < {self.signal_cooldown}s"
+                "冷却时间未到: %.1fs < %ss", current_time - last_signal_time, self.signal_cooldown
             )
             return False
         
@@ -258,7 +274,7 @@ class SignalFilter:
         if latest_kline.volume < self.market_filters["min_volume"]:
             self._log_filter_reason(
                 signal, "low_volume",
-                f"成交量({latest_kline.volume:.0f}) < 最小要求({self.market_filters['min_volume']})"
+                "成交量(%.0f) < 最小要求(%s)", latest_kline.volume, self.market_filters["min_volume"]
             )
             return False
         
@@ -269,7 +285,7 @@ class SignalFilter:
         if signal.price < self.market_filters["min_price"]:
             self._log_filter_reason(
                 signal, "low_price",
-                f"价格({signal.price:.6f}) < 最小要求({self.market_filters['min_price']})"
+                "价格(%.6f) < 最小要求(%s)", signal.price, self.market_filters["min_price"]
             )
             return False
         
@@ -281,21 +297,17 @@ class SignalFilter:
         if not market_data or not market_data.klines:
             return True  # 无数据时不过滤
         
-        # 计算近期波动率
-        prices = [k.close for k in market_data.klines[-20:]]  # 最近20个周期
-        if len(prices) < 10:
-            return True
-        
-        volatility = MathUtils.calculate_volatility(prices, len(prices))
-        if not volatility:
+        if len(market_data.klines) < 10:
             return True
         
-        current_vol = volatility[-1] if volatility else 0
+        # 近期波动率：最近20个周期对数收益率的样本标准差（收盘价列在 MarketData 上缓存，同批信号复用）
+        prices = market_data.closes[-20:]
+        current_vol = float(np.diff(np.log(prices)).std(ddof=1))
         threshold = self.market_filters["volatility_threshold"]
         if current_vol > threshold:
             self._log_filter_reason(
                 signal, "high_volatility",
-                f"波动率({current_vol:.4f}) > 阈值({threshold})"
+                "波动率(%.4f) > 阈值(%s)", current_vol, threshold
             )
             return False
         
@@ -303,28 +315,27 @@ class SignalFilter:
     
     def _filter_by_blacklist(self, signal: Signal, context: Dict[str, Any]) -> bool:
         """黑名单过滤"""
-        if signal.symbol in self.risk_filters["blacklist_symbols"]:
-            self._log_filter_reason(signal, "blacklisted", f"交易对在黑名单中: {signal.symbol}")
+        if signal.symbol in self._blacklist:
+            self._log_filter_reason(signal, "blacklisted", "交易对在黑名单中: %s", signal.symbol)
             return False
         
         return True
     
     def _filter_duplicates(self, signal: Signal, context: Dict[str, Any]) -> bool:
-        """重复信号过滤"""
-        signal_history = context["signal_history"]
-        current_time = context["current_time"]
+        """重复信号过滤（同交易对同方向、10分钟内、价格相差1%以内且置信度相差0.1以内）"""
+        entries = self._dup_index.get((signal.symbol, signal.side))
+        if not entries:
+            return True
         
-        for historical_signal in signal_history[-50:]:  # 检查最近50个信号
-            # 时间窗口检查（10分钟内）
-            if current_time - (historical_signal.timestamp / 1000) > 600:
-                continue
-            
-            # 检查是否为相似信号
-            if self._are_signals_similar(signal, historical_signal):
-                self._log_filter_reason(
-                    signal, "duplicate",
-                    f"与历史信号相似: {historical_signal.id}"
-                )
+        window_start = (context["current_time"] - DUPLICATE_WINDOW) * 1000
+        price = signal.price
+        confidence = signal.confidence
+        # 从最新的信号往前检查，超出时间窗口即可停止
+        for timestamp, hist_price, hist_confidence, signal_id in reversed(entries):
+            if timestamp < window_start:
+                break
+            if abs(price - hist_price) <= 0.01 * hist_price and abs(confidence - hist_confidence) <= 0.1:
+                self._log_filter_reason(signal, "duplicate", "与历史信号相似: %s", signal_id)
                 return False
         
         return True
@@ -334,30 +345,12 @@ class SignalFilter:
         if self._daily_signal_count >= self.risk_filters["max_daily_signals"]:
             self._log_filter_reason(
                 signal, "daily_limit",
-                f"已达每日信号上限: {self._daily_signal_count}/{self.risk_filters['max_daily_signals']}"
+                "已达每日信号上限: %s/%s", self._daily_signal_count, self.risk_filters["max_daily_signals"]
             )
             return False
         
         return True
     
-    def _are_signals_similar(self, signal1: Signal, signal2: Signal) -> bool:
-        """判断两个信号是否相似"""
-        # 相同交易对和方向
-        if signal1.symbol != signal2.symbol or signal1.side != signal2.side:
-            return False
-        
-        # 价格相近（1%以内）
-        price_diff = abs(signal1.price - signal2.price) / signal2.price
-        if price_diff > 0.01:
-            return False
-        
-        # 置信度相近
-        confidence_diff = abs(signal1.confidence - signal2.confidence)
-        if confidence_diff > 0.1:
-            return False
-        
-        return True
-    
     def _post_process_signals(self, signals: List[Signal]) -> List[Signal]:
         """后处理信号：去重、排序、限制数量"""
         if not signals:
@@ -389,37 +382,64 @@ class SignalFilter:
         # 更新交易对最后信号时间
         self._symbol_last_signal[signal.symbol] = current_time
         
-        # 添加到历史记录
+        # 添加到历史记录（deque 自动丢弃最旧的记录）
         self._signal_history.append(signal)
         
-        # 限制历史记录大小
-        if len(self._signal_history) > 1000:
-            self._signal_history = self._signal_history[-500:]
+        # 更新重复信号索引，顺带丢弃已超出时间窗口的记录
+        key = (signal.symbol, signal.side)
+        entries = self._dup_index.get(key)
+        if entries is None:
+            entries = self._dup_index[key] = deque(maxlen=DUPLICATE_INDEX_SIZE)
+        window_start = (current_time - DUPLICATE_WINDOW) * 1000
+        while entries and entries[0][0] < window_start:
+            entries.popleft()
+        entries.append((signal.timestamp, signal.price, signal.confidence, signal.id))
         
         # 更新每日计数
         self._daily_signal_count += 1
     
     def _reset_daily_count_if_needed(self) -> None:
-        """检查并重置每日计数"""
+        """检查并重置每日计数（未到下一个零点时只需一次时间戳比较）"""
+        if time.time() < self._next_reset_time:
+            return
+        
         current_date = datetime.now().date()
         if current_date != self._last_reset_date:
             self._daily_signal_count = 0
             self._last_reset_date = current_date
             self.logger.info(f"每日信号计数已重置: {current_date}")
+        self._next_reset_time = self._next_midnight(current_date)
     
-    def _log_filter_reason(self, signal: Signal, reason: str, details: str) -> None:
-        """记录过滤原因"""
+    @staticmethod
+    def _next_midnight(day: date) -> float:
+        """指定日期次日零点（本地时间）的时间戳"""
+        return datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
+    
+    def _log_filter_reason(self, signal: Signal, reason: str, details: str, *args: Any) -> None:
+        """记录过滤原因（details 为 %-格式模板，只在启用 DEBUG 日志时才格式化）"""
         self._stats["filter_reasons"][reason] += 1
-        self.logger.debug(f"信号被过滤: {signal.symbol} - {reason}: {details}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("信号被过滤: %s - %s: " + details, signal.symbol, reason, *args)
+    
+    def _set_blacklist(self, symbols: Iterable[str]) -> None:
+        """
+        替换黑名单
+        
+        黑名单为驻留字符串组成的 frozenset，只在增删时重建；过滤时直接读取 self._blacklist，
+        risk_filters["blacklist_symbols"] 指向同一对象。
+        """
+        blacklist = frozenset(sys.intern(symbol) for symbol in symbols)
+        self._blacklist = blacklist
+        self.risk_filters["blacklist_symbols"] = blacklist
     
     def add_blacklist_symbol(self, symbol: str) -> None:
         """添加黑名单交易对"""
-        self.risk_filters["blacklist_symbols"].add(symbol.upper())
+        self._set_blacklist(self._blacklist | {symbol.upper()})
         self.logger.info(f"已添加黑名单交易对: {symbol}")
     
     def remove_blacklist_symbol(self, symbol: str) -> None:
         """移除黑名单交易对"""
-        self.risk_filters["blacklist_symbols"].discard(symbol.upper())
+        self._set_blacklist(self._blacklist - {symbol.upper()})
         self.logger.info(f"已移除黑名单交易对: {symbol}")
     
     def update_config(self, config: Dict[str, Any]) -> None:
@@ -465,10 +485,11 @@ class SignalFilter:
     
     def get_blacklist(self) -> Set[str]:
         """获取黑名单列表"""
-        return self.risk_filters["blacklist_symbols"].copy()
+        return set(self._blacklist)
     def clear_history(self) -> None:
         """清理历史记录"""
         self._signal_history.clear()
+        self._dup_index.clear()
         self._symbol_last_signal.clear()
         self.logger.info("信号历史记录已清理")
 
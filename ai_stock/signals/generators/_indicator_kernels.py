@@ -0,0 +1,88 @@
+# 技术指标计算内核（Python版）
+# 输入为连续的 float64 NumPy 数组（SoA 布局），安装 numba 时 JIT 编译，否则按纯 Python 执行
+# 输出与 MathUtils 对应函数一致：序列从第一个完整窗口开始，长度为 n - period + 1
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def rolling_mean_std(values: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """滚动均值和样本标准差（与 statistics.stdev 相同，ddof=1）
+
+    不使用 parallel=True：并行后端首次在非主线程中调用时会导致解释器退出挂起
+    """
+    m = values.shape[0] - period + 1
+    if m <= 0:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+    means = np.empty(m, dtype=np.float64)
+    stds = np.empty(m, dtype=np.float64)
+    for i in range(m):
+        total = 0.0
+        for j in range(i, i + period):
+            total += values[j]
+        mean = total / period
+        sq = 0.0
+        for j in range(i, i + period):
+            d = values[j] - mean
+            sq += d * d
+        means[i] = mean
+        stds[i] = np.sqrt(sq / (period - 1)) if period > 1 else 0.0
+    return means, stds
+
+
+@njit(cache=True, fastmath=True)
+def rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """滚动均值（前缀和，O(n)）"""
+    m = values.shape[0] - period + 1
+    if m <= 0:
+        return np.empty(0, dtype=np.float64)
+    out = np.empty(m, dtype=np.float64)
+    total = 0.0
+    for j in range(period):
+        total += values[j]
+    out[0] = total / period
+    for i in range(1, m):
+        total += values[i + period - 1] - values[i - 1]
+        out[i] = total / period
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def rsi(closes: np.ndarray, period: int) -> np.ndarray:
+    """Wilder 平滑 RSI (0-100)"""
+    n = closes.shape[0]
+    if n < period + 1:
+        return np.empty(0, dtype=np.float64)
+    out = np.empty(n - period, dtype=np.float64)
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = closes[i] - closes[i - 1]
+        if d > 0:
+            avg_gain += d
+        else:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+    out[0] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    for i in range(period + 1, n):
+        d = closes[i] - closes[i - 1]
+        gain = d if d > 0 else 0.0
+        loss = -d if d < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        out[i - period] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
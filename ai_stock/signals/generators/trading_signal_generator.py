@@ -11,13 +11,14 @@ from typing import List, Optional, Dict, Any, Callable
 from datetime import datetime
 import time
 import asyncio
+import numpy as np
 
 from ai_stock.core.interfaces import BaseSignalGenerator
 from ai_stock.core.types import MarketData, Signal, OrderSide, SignalStrength, Kline
 from ai_stock.core.exceptions import SignalGenerationError, ValidationError
-from ai_stock.utils.math_utils import MathUtils
 from ai_stock.utils.logging_utils import get_logger
 from ai_stock.utils.validation_utils import ValidationUtils
+from ai_stock.signals.generators._indicator_kernels import rolling_mean, rolling_mean_std, rsi
 
 
 class TradingSignalGenerator(BaseSignalGenerator):
@@ -80,9 +81,9 @@ class TradingSignalGenerator(BaseSignalGenerator):
             # 缓存市场数据
             self._market_data_cache[symbol] = market_data
             
-            # 提取价格数据
-            prices = [kline.close for kline in market_data.klines]
-            volumes = [kline.volume for kline in market_data.klines]
+            # 提取价格数据（连续 float64 数组，供指标内核使用）
+            prices = market_data.closes
+            volumes = market_data.volumes
             
             if len(prices) < max(self.sma_long_period, self.rsi_period, self.bb_period):
                 self.logger.warning(f"数据不足，无法计算技术指标: {symbol}")
@@ -133,39 +134,28 @@ class TradingSignalGenerator(BaseSignalGenerator):
     
     def _calculate_indicators(
         self,
-        prices: List[float],
-        volumes: List[float]
+        prices: np.ndarray,
+        volumes: np.ndarray
     ) -> Dict[str, Any]:
-        """计算技术指标"""
+        """计算技术指标（仅计算信号规则用到的指标）"""
         indicators = {}
         
         try:
             # 移动平均线
-            indicators["sma_short"] = MathUtils.calculate_sma(prices, self.sma_short_period)
-            indicators["sma_long"] = MathUtils.calculate_sma(prices, self.sma_long_period)
+            indicators["sma_short"] = rolling_mean(prices, self.sma_short_period)
+            indicators["sma_long"] = rolling_mean(prices, self.sma_long_period)
             
             # RSI
-            indicators["rsi"] = MathUtils.calculate_rsi(prices, self.rsi_period)
+            indicators["rsi"] = rsi(prices, self.rsi_period)
             
             # 布林线
-            bb_upper, bb_middle, bb_lower = MathUtils.calculate_bollinger_bands(
-                prices, self.bb_period, self.bb_std_dev
-            )
-            indicators["bb_upper"] = bb_upper
+            bb_middle, bb_std = rolling_mean_std(prices, self.bb_period)
+            indicators["bb_upper"] = bb_middle + self.bb_std_dev * bb_std
             indicators["bb_middle"] = bb_middle
-            indicators["bb_lower"] = bb_lower
-            
-            # MACD
-            macd_line, signal_line, histogram = MathUtils.calculate_macd(prices)
-            indicators["macd_line"] = macd_line
-            indicators["macd_signal"] = signal_line
-            indicators["macd_histogram"] = histogram
-            
-            # 波动率
-            indicators["volatility"] = MathUtils.calculate_volatility(prices)
+            indicators["bb_lower"] = bb_middle - self.bb_std_dev * bb_std
             
             # 成交量移动平均
-            indicators["volume_ma"] = MathUtils.calculate_sma(volumes, 20) if volumes else []
+            indicators["volume_ma"] = rolling_mean(volumes, 20)
             
         except Exception as e:
             self.logger.error(f"技术指标计算失败: {e}")
@@ -176,7 +166,7 @@ class TradingSignalGenerator(BaseSignalGenerator):
     def _generate_ma_crossover_signal(
         self,
         symbol: str,
-        prices: List[float],
+        prices: np.ndarray,
         indicators: Dict[str, Any]
     ) -> Optional[Signal]:
         """生成移动平均线交叉信号"""
@@ -192,7 +182,7 @@ class TradingSignalGenerator(BaseSignalGenerator):
         prev_short = sma_short[-2]
         prev_long = sma_long[-2]
         
-        current_price = prices[-1]
+        current_price = float(prices[-1])
         
         # 金叉：短期均线上穿长期均线
         if prev_short <= prev_long and current_short > current_long:
@@ -229,17 +219,17 @@ class TradingSignalGenerator(BaseSignalGenerator):
     def _generate_rsi_signal(
         self,
         symbol: str,
-        prices: List[float],
+        prices: np.ndarray,
         indicators: Dict[str, Any]
     ) -> Optional[Signal]:
         """生成RSI信号"""
         rsi_values = indicators.get("rsi", [])
         
-        if not rsi_values:
+        if len(rsi_values) == 0:
             return None
         
         current_rsi = rsi_values[-1]
-        current_price = prices[-1]
+        current_price = float(prices[-1])
         
         # RSI超卖信号
         if current_rsi < self.rsi_oversold:
@@ -276,7 +266,7 @@ class TradingSignalGenerator(BaseSignalGenerator):
     def _generate_bollinger_signal(
         self,
         symbol: str,
-        prices: List[float],
+        prices: np.ndarray,
         indicators: Dict[str, Any]
     ) -> Optional[Signal]:
         """生成布林线信号"""
@@ -284,10 +274,10 @@ class TradingSignalGenerator(BaseSignalGenerator):
         bb_lower = indicators.get("bb_lower", [])
         bb_middle = indicators.get("bb_middle", [])
         
-        if not bb_upper or not bb_lower or not bb_middle:
+        if len(bb_upper) == 0 or len(bb_lower) == 0 or len(bb_middle) == 0:
             return None
         
-        current_price = prices[-1]
+        current_price = float(prices[-1])
         current_upper = bb_upper[-1]
         current_lower = bb_lower[-1]
         current_middle = bb_middle[-1]
@@ -327,16 +317,16 @@ class TradingSignalGenerator(BaseSignalGenerator):
     def _generate_volume_signal(
         self,
         symbol: str,
-        prices: List[float],
-        volumes: List[float]
+        prices: np.ndarray,
+        volumes: np.ndarray
     ) -> Optional[Signal]:
         """生成成交量信号"""
         if len(volumes) < 20:
             return None
         
-        current_volume = volumes[-1]
-        avg_volume = sum(volumes[-20:]) / 20
-        current_price = prices[-1]
+        current_volume = float(volumes[-1])
+        avg_volume = float(volumes[-20:].mean())
+        current_price = float(prices[-1])
         prev_price = prices[-2] if len(prices) > 1 else current_price
         
         # 放量上涨
@@ -403,7 +393,7 @@ class TradingSignalGenerator(BaseSignalGenerator):
         self,
         fast_ma: float,
         slow_ma: float,
-        prices: List[float]
+        prices: np.ndarray
     ) -> float:
         """计算移动平均线信号置信度"""
         # 基于均线差距和价格趋势计算置信度
@@ -511,15 +501,15 @@ class TradingSignalGenerator(BaseSignalGenerator):
                 self._signal_history = self._signal_history[-500:]
         
         # 更新内部统计
-        self._stats["active_signals"] = len([
+        self._active_signals = len([
             s for s in self._signal_history 
             if time.time() - (s.timestamp / 1000) < 3600  # 1小时内的信号
         ])
-        self._stats["total_signals_generated"] += len(signals)
+        self._total_signals_generated += len(signals)
         
-        if self._stats["total_signals_generated"] > 0:
+        if signals:
             confidence_sum = sum(s.confidence for s in signals)
-            self._stats["avg_confidence"] = confidence_sum / len(signals)
+            self._avg_confidence = confidence_sum / len(signals)
     
     async def _safe_callback(self, signal: Signal) -> None:
         """安全执行回调"""
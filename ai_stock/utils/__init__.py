@@ -11,6 +11,7 @@ from ai_stock.utils.date_utils import DateUtils
 from ai_stock.utils.math_utils import MathUtils
 from ai_stock.utils.config_utils import ConfigUtils
 from ai_stock.utils.validation_utils import ValidationUtils
+from ai_stock.utils.json_utils import JsonUtils
 from ai_stock.utils.logging_utils import setup_logger, get_logger
 
 __all__ = [
@@ -19,6 +20,7 @@ __all__ = [
     "MathUtils",
     "ConfigUtils",
     "ValidationUtils",
+    "JsonUtils",
     "setup_logger",
     "get_logger",
 ]
\ No newline at end of file
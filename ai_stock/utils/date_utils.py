@@ -7,11 +7,18 @@ AI Stock Trading System - 日期时间工具
 """
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Union, Optional
 import time
 import pytz
 
 
+@lru_cache(maxsize=1024)
+def _parse_date(date_str: str, format_str: str = "%Y-%m-%d") -> datetime:
+    """解析日期字符串（带缓存，datetime 不可变可安全复用）"""
+    return datetime.strptime(date_str, format_str)
+
+
 class DateUtils:
     """日期时间工具类"""
     
@@ -131,7 +138,7 @@ class DateUtils:
         Returns:
             datetime对象
         """
-        dt = datetime.strptime(date_str, format_str)
+        dt = _parse_date(date_str, format_str)
         
         if timezone_info:
             dt = dt.replace(tzinfo=timezone_info)
@@ -140,6 +147,29 @@ class DateUtils:
         
         return dt
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def validate_date_range(
+        start_date: str,
+        end_date: str,
+        format_str: str = "%Y-%m-%d"
+    ) -> bool:
+        """
+        验证日期范围
+        
+        Args:
+            start_date: 开始日期字符串
+            end_date: 结束日期字符串
+            format_str: 格式字符串
+            
+        Returns:
+            日期格式正确且开始日期不晚于结束日期时返回True
+        """
+        try:
+            return _parse_date(start_date, format_str) <= _parse_date(end_date, format_str)
+        except (ValueError, TypeError):
+            return False
+    
     @staticmethod
     def get_trading_day_start(
         date: Union[datetime, str],
@@ -7,9 +7,11 @@ AI Stock Trading System - 格式化工具
 """
 
 from decimal import Decimal
-from typing import Union, Optional
+from typing import Union, Optional, Sequence
 import locale
 
+import numpy as np
+
 
 class FormatUtils:
     """格式化工具类"""
@@ -91,6 +93,26 @@ class FormatUtils:
         except (ValueError, TypeError):
             return "N/A"
     
+    @staticmethod
+    def format_percentage_array(
+        values: Sequence[Optional[float]],
+        precision: int = 2
+    ) -> np.ndarray:
+        """
+        批量格式化百分比（与 format_percentage 规则一致的向量化版本）
+        
+        Args:
+            values: 数值序列，None 输出 "N/A"
+            precision: 小数位数
+            
+        Returns:
+            格式化后的字符串数组
+        """
+        arr = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        arr = np.where(np.abs(arr) <= 1, arr * 100, arr)
+        formatted = np.char.mod(f"%.{precision}f%%", arr)
+        return np.where(np.isnan(arr), "N/A", formatted)
+    
     @staticmethod
     def format_currency(
         amount: Union[int, float, Decimal], 
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI Stock Trading System - JSON序列化工具
+
+安装 orjson 时使用 orjson 进行序列化，否则回退到标准库 json。
+"""
+
+import json
+from typing import Any, IO, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """无法直接序列化的对象：NumPy 数组/标量转为原生类型，其余转为字符串"""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return str(obj)
+
+
+class JsonUtils:
+    """JSON序列化工具类"""
+
+    @staticmethod
+    def dumpb(data: Any, indent: bool = False) -> bytes:
+        """
+        序列化为 UTF-8 字节串
+
+        Args:
+            data: 待序列化数据
+            indent: 是否以 2 空格缩进输出
+
+        Returns:
+            JSON 字节串
+        """
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, default=_default, option=option)
+
+        return json.dumps(
+            data,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+            ensure_ascii=False,
+            default=_default
+        ).encode("utf-8")
+
+    @staticmethod
+    def dumps(data: Any, indent: bool = False) -> str:
+        """序列化为字符串"""
+        return JsonUtils.dumpb(data, indent=indent).decode("utf-8")
+
+    @staticmethod
+    def loads(data: Union[str, bytes]) -> Any:
+        """
+        反序列化 JSON 字符串或字节串
+
+        Raises:
+            json.JSONDecodeError: JSON 格式错误（orjson 的异常同样是其子类）
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    @staticmethod
+    def dump(data: Any, fp: IO[str], indent: bool = True) -> None:
+        """序列化并写入文本文件对象"""
+        fp.write(JsonUtils.dumps(data, indent=indent))
+
+    @staticmethod
+    def load(fp: IO[str]) -> Any:
+        """从文本文件对象读取并反序列化"""
+        return JsonUtils.loads(fp.read())
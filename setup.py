@@ -43,7 +43,14 @@ setup(
             "tensorflow>=2.10.0",
             "torch>=1.13.0",
             "xgboost>=1.7.0",
-        ]
+        ],
+        "speedups": [
+            "numba>=0.57.0",
+            "orjson>=3.9.0",
+            "diskcache>=5.6.0",
+            "pyarrow>=12.0.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+        ],
     },
     classifiers=[
         "Development Status :: 4 - Beta",